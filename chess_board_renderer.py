@@ -8,6 +8,10 @@ PIECE_SYMBOLS = {
     'k': '♚', 'q': '♛', 'r': '♜', 'b': '♝', 'n': '♞', 'p': '♟'   # Black pieces
 }
 
+# Material points and display order (most valuable first) by piece symbol
+PIECE_VALUES = {'P': 1, 'p': 1, 'N': 3, 'n': 3, 'B': 3, 'b': 3, 'R': 5, 'r': 5, 'Q': 9, 'q': 9, 'K': 0, 'k': 0}
+PIECE_ORDER = {'Q': 0, 'q': 0, 'R': 1, 'r': 1, 'B': 2, 'b': 2, 'N': 3, 'n': 3, 'P': 4, 'p': 4}
+
 def render_chess_board_with_info(board: chess.Board, player_info=None, highlight_squares=None, last_move=None, board_size=400):
     """
     Render a beautiful chess board with player info and captured pieces.
@@ -32,8 +36,8 @@ def render_chess_board_with_info(board: chess.Board, player_info=None, highlight
     combined_highlights = highlight_squares[:] if highlight_squares else []
     if last_move:
         # Add from and to squares of the last move for yellow highlighting
-        from_square = chess.square_name(last_move.from_square)
-        to_square = chess.square_name(last_move.to_square)
+        from_square = chess.SQUARE_NAMES[last_move.from_square]
+        to_square = chess.SQUARE_NAMES[last_move.to_square]
         combined_highlights.extend([from_square, to_square])
     
     # Generate the basic board HTML
@@ -118,14 +122,11 @@ def get_captured_pieces(board: chess.Board):
         'black': {'p': 0, 'r': 0, 'n': 0, 'b': 0, 'q': 0, 'k': 0}
     }
     
-    # Count pieces currently on the board
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            if piece.color == chess.WHITE:
-                current_pieces['white'][piece.symbol().upper()] += 1
-            else:
-                current_pieces['black'][piece.symbol().lower()] += 1
+    # Count pieces currently on the board from the per-type bitboards
+    for color, side in ((chess.WHITE, 'white'), (chess.BLACK, 'black')):
+        for symbol in current_pieces[side]:
+            piece_type = chess.PIECE_SYMBOLS.index(symbol.lower())
+            current_pieces[side][symbol] = chess.popcount(board.pieces_mask(piece_type, color))
     
     # Calculate captured pieces
     captured = {'white': [], 'black': []}
@@ -160,28 +161,16 @@ def format_captured_pieces(pieces_list):
         return "—"
     
     # Sort pieces by value (most valuable first)
-    piece_order = {'Q': 0, 'q': 0, 'R': 1, 'r': 1, 'B': 2, 'b': 2, 'N': 3, 'n': 3, 'P': 4, 'p': 4}
-    sorted_pieces = sorted(pieces_list, key=lambda x: piece_order.get(x, 5))
-    
-    # Convert to Unicode symbols
-    symbols = []
-    for piece in sorted_pieces:
-        if piece.isupper():
-            symbols.append(PIECE_SYMBOLS[piece])
-        else:
-            symbols.append(PIECE_SYMBOLS[piece])
+    sorted_pieces = sorted(pieces_list, key=lambda x: PIECE_ORDER.get(x, 5))
     
-    return ''.join(symbols)
+    # Convert to Unicode symbols (PIECE_SYMBOLS is keyed by case, so no colour branch is needed)
+    return ''.join(PIECE_SYMBOLS[piece] for piece in sorted_pieces)
 
 def calculate_captured_score(pieces_list):
     """Calculate score for a list of captured pieces (material points)."""
     if not pieces_list:
         return 0
-    values = {'P': 1, 'p': 1, 'N': 3, 'n': 3, 'B': 3, 'b': 3, 'R': 5, 'r': 5, 'Q': 9, 'q': 9, 'K': 0, 'k': 0}
-    score = 0
-    for p in pieces_list:
-        score += values.get(p, 0)
-    return score
+    return sum(PIECE_VALUES.get(p, 0) for p in pieces_list)
 
 def render_chess_board(board: chess.Board, highlight_squares=None, board_size=400):
     """
@@ -296,7 +285,7 @@ def render_chess_board(board: chess.Board, highlight_squares=None, board_size=40
     for rank in range(8, 0, -1):  # 8, 7, 6, 5, 4, 3, 2, 1
         for file in range(8):  # 0, 1, 2, 3, 4, 5, 6, 7 (a-h)
             square_index = chess.square(file, rank - 1)
-            square_name = chess.square_name(square_index)
+            square_name = chess.SQUARE_NAMES[square_index]
             
             # Determine square color
             is_light = (rank + file) % 2 == 1
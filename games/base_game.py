@@ -5,8 +5,17 @@ import random
 from logger import GameLogger
 from api_utils import get_api_function, extract_reasoning
 import config
+import logging
 import time
 
+try:
+    from debug_console import debug_log
+except ImportError:
+    # Fallback if the debug console is not available
+    debug_log = lambda *args, **kwargs: None
+
+logger = logging.getLogger(__name__)
+
 
 class BaseGame(ABC):
     """Abstract base class for all game implementations."""
@@ -137,9 +146,9 @@ class BaseGame(ABC):
         
         try:
             # Call the appropriate API
-            print(f"DEBUG: Game calling API for {player_name} with model {config['model']}")
-            print(f"DEBUG: Prompt length: {len(prompt)} characters")
-            print(f"DEBUG: First 100 chars of prompt: {prompt[:100]}...")
+            logger.debug("Game calling API for %s with model %s", player_name, config['model'])
+            logger.debug("Prompt length: %d characters", len(prompt))
+            logger.debug("First 100 chars of prompt: %s...", prompt[:100])
             
             # Allow subclasses to influence model parameters (e.g., endgame determinism)
             model_params = {}
@@ -158,16 +167,15 @@ class BaseGame(ABC):
             )
             api_ms = int((time.time() - start_ts) * 1000)
             try:
-                from debug_console import debug_log
                 debug_log(f"API Call: model={config['model']}, temp={model_params.get('temperature')}, max_tokens={model_params.get('max_tokens')}, latency_ms={api_ms}")
             except Exception:
                 pass
             
-            print(f"DEBUG: API response length: {len(response) if response else 0}")
+            logger.debug("API response length: %d", len(response) if response else 0)
             if response:
-                print(f"DEBUG: First 100 chars of response: {response[:100]}...")
+                logger.debug("First 100 chars of response: %s...", response[:100])
             else:
-                print("DEBUG: No response received from API")
+                logger.debug("No response received from API")
             
             if not response:
                 return None, "No response received from API"
@@ -176,7 +184,6 @@ class BaseGame(ABC):
             action = self.parse_action_from_response(response)
             reasoning = extract_reasoning(response)
             try:
-                from debug_console import debug_log
                 debug_log(f"Parsed action: {'<none>' if not action else action}; Reasoning len: {len(reasoning) if reasoning else 0}")
             except Exception:
                 pass
@@ -223,9 +230,8 @@ class BaseGame(ABC):
             self.logger.log_error("no_legal_moves", "No legal moves available - game should end")
             return False
         
-        print(f"DEBUG: Making move for {player_name}, {len(legal_actions)} legal moves available")
+        logger.debug("Making move for %s, %d legal moves available", player_name, len(legal_actions))
         try:
-            from debug_console import debug_log
             debug_log(f"Making move for {player_name}, {len(legal_actions)} legal moves available")
         except:
             pass
@@ -319,18 +325,17 @@ class BaseGame(ABC):
                 self.failed_moves[player_name].clear()
                 self._last_failure_reason[player_name] = ""
                 self.next_player()
-                print(f"DEBUG: Move {action} successful, switched to {self.current_player}")
+                logger.debug("Move %s successful, switched to %s", action, self.current_player)
                 try:
-                    from debug_console import debug_log
-                    debug_log(f"SUCCESS: Move {action} applied, switched to {self.current_player}")
+                    message = f"SUCCESS: Move {action} applied, switched to {self.current_player}"
                     # Turn total timing if exposed by subclass
                     try:
                         if hasattr(self, '_turn_start_ts'):
-                            import time
                             total_ms = int((time.time() - getattr(self, '_turn_start_ts')) * 1000)
-                            debug_log(f"TURN_TIMINGS: total_turn_ms={total_ms}, attempts={attempt+1}/{max_attempts}")
+                            message += f"\nTURN_TIMINGS: total_turn_ms={total_ms}, attempts={attempt+1}/{max_attempts}"
                     except Exception:
                         pass
+                    debug_log(message)
                 except:
                     pass
                 return True
@@ -354,12 +359,11 @@ class BaseGame(ABC):
                 except Exception:
                     vetoed = False
                 label = "vetoed (policy)" if vetoed else "invalid"
-                print(f"DEBUG: Move {action} {label}, attempt {attempt + 1}/{max_attempts}")
-                print(f"DEBUG: Failed moves for {player_name}: {list(self.failed_moves[player_name])}")
+                logger.debug("Move %s %s, attempt %d/%d", action, label, attempt + 1, max_attempts)
+                logger.debug("Failed moves for %s: %s", player_name, self.failed_moves[player_name])
                 try:
-                    from debug_console import debug_log
-                    debug_log(f"FAILED: Move {action} {label}, attempt {attempt + 1}/{max_attempts}")
-                    debug_log(f"Failed moves for {player_name}: {list(self.failed_moves[player_name])}")
+                    debug_log(f"FAILED: Move {action} {label}, attempt {attempt + 1}/{max_attempts}\n"
+                              f"Failed moves for {player_name}: {list(self.failed_moves[player_name])}")
                 except:
                     pass
                 # Do not consume attempt on veto; allow up to 3 veto retries
@@ -374,7 +378,7 @@ class BaseGame(ABC):
                     except Exception:
                         pass
                     if veto_retries >= 3:
-                        print("DEBUG: Exceeded veto retries; using safe fallback")
+                        logger.debug("Exceeded veto retries; using safe fallback")
                         legal_actions = self.get_legal_actions()
                         try:
                             if hasattr(self, 'get_safe_fallback_action') and callable(getattr(self, 'get_safe_fallback_action')):
@@ -384,7 +388,7 @@ class BaseGame(ABC):
                         except Exception:
                             fallback_move = random.choice(legal_actions)
                     
-                        print(f"DEBUG: Forcing fallback legal move: {fallback_move}")
+                        logger.debug("Forcing fallback legal move: %s", fallback_move)
                         # Bypass blunder veto exactly once for this forced fallback
                         try:
                             setattr(self, '_force_apply_once', fallback_move)
@@ -426,7 +430,7 @@ class BaseGame(ABC):
                             fallback_move = random.choice(legal_actions)
                     except Exception:
                         fallback_move = random.choice(legal_actions)
-                    print(f"DEBUG: Forcing fallback legal move: {fallback_move}")
+                    logger.debug("Forcing fallback legal move: %s", fallback_move)
                     if self.validate_and_apply_action(fallback_move):
                         self.logger.log_move(
                             player=player_name,
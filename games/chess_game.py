@@ -1,7 +1,7 @@
 """Chess game implementation using python-chess library."""
 import chess
 import chess.pgn
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 import re
 import json
 import time
@@ -13,8 +13,285 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from api_utils import parse_chess_move
 import io
+import itertools
+import logging
 import random
 
+try:
+    from debug_console import debug_log
+except ImportError:
+    # Fallback if the debug console is not available
+    debug_log = lambda *args, **kwargs: None
+
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns for response parsing
+_CANDIDATES_RE = re.compile(r"candidates\s*:", re.IGNORECASE)
+_CANDIDATES_SECTION_RE = re.compile(r"CANDIDATES\s*:\s*([\s\S]+?)(?:\n\s*(MOVE\s*:|REASONING\s*:)|$)", re.IGNORECASE)
+_FIRST_LINE_MOVE_RE = re.compile(r"^(MOVE\s*:|\{\s*\"?move\"?\s*:)", re.IGNORECASE)
+_JSON_MOVE_RE = re.compile(r"\{\s*\"?move\"?\s*:\s*\"([^\"]+)\"\s*\}", re.IGNORECASE)
+_MOVE_LINE_RE = re.compile(r"(?is)MOVE\s*:\s*(?:\[\s*)?(.+?)(?:\s*\]|\s*REASONING\s*:|\n|\r|$)", re.IGNORECASE)
+_TRAIL_PUNCT_RE = re.compile(r"[\.;,:]+$")
+_WS_RE = re.compile(r"\s+")
+_BARE_SQUARE_RE = re.compile(r"[a-h][1-8]", re.IGNORECASE)
+_UCI_SHAPE_RE = re.compile(r"[a-h][1-8][a-h][1-8][nbrqNBRQ]?")
+# Zero-width lookahead so overlapping UCI-shaped substrings are all reported
+_UCI_TOKEN_RE = re.compile(r"(?=([a-h][1-8][a-h][1-8][nbrq]?))")
+# A first line that is exactly "MOVE: <uci>" (UCI kept lowercase, as the plain UCI parser expects)
+_FAST_UCI_LINE_RE = re.compile(r"\s*(?i:MOVE)\s*:\s*([a-h][1-8][a-h][1-8][nbrq]?)\s*")
+_REASONING_RE = re.compile(r"REASONING\s*:\s*([\s\S]+)$", re.IGNORECASE)
+
+# Word-bounded search patterns for individual SAN tokens, compiled on first use
+_SAN_TOKEN_PATTERNS: dict = {}
+
+
+def _san_token_re(token: str) -> re.Pattern:
+    """Return the compiled standalone-token pattern for a SAN string."""
+    pattern = _SAN_TOKEN_PATTERNS.get(token)
+    if pattern is None:
+        pattern = _SAN_TOKEN_PATTERNS[token] = re.compile(
+            rf"(?<![A-Za-z0-9_]){re.escape(token)}(?![A-Za-z0-9_])")
+    return pattern
+
+# Static prompt sections; only the phase strategy line varies inside the guide
+_STRATEGY_GUIDES = {
+    'opening': (
+        "Opening principles: Develop pieces quickly, control the center (e4/d4/e5/d5), "
+        "ensure king safety (consider castling), and avoid early queen sorties or loose pawn moves."
+    ),
+    'middlegame': (
+        "Middlegame principles: Improve worst-placed piece, coordinate forces, "
+        "calculate tactics (pins, forks, discovered attacks), and evaluate trades."
+    ),
+    'endgame': (
+        "Endgame principles: Activate the king, create and push passed pawns, "
+        "use opposition and triangulation, and avoid stalemate tricks."
+    ),
+}
+_IN_CHECK_GUIDE = " You are in check: consider only moves that resolve the check (block, capture, or move the king)."
+_GUIDE_TEMPLATE = (
+    "Consider the following strategy guide for this phase:\n- %s\n"
+    "- Prefer moves that improve piece activity and king safety.\n"
+    "- Calculate 1-2 moves ahead for opponent replies to avoid blunders."
+)
+# Fully rendered guide sections keyed by (phase, in_check), built once at import
+_GUIDE_SECTIONS = {
+    (phase, in_check): _GUIDE_TEMPLATE % (guide + (_IN_CHECK_GUIDE if in_check else ""))
+    for phase, guide in _STRATEGY_GUIDES.items()
+    for in_check in (False, True)
+}
+_OPTIONS_INSTRUCTION = (
+    "Choose your move from the provided legal move sample or propose another move if you believe it is superior, "
+    "but ensure it is legal in the current position. Prefer SAN or UCI. If uncertain, consider SAFE_SUGGESTIONS."
+)
+_PROTOCOL_SECTION = (
+    "Respond with exactly two lines:\n"
+    "REASONING: <concise step-by-step analysis>\n"
+    "MOVE: <SAN or UCI>"
+)
+# Compact one-line state block; string fields are quote-escaped by the caller
+_STATE_JSON_TEMPLATE = (
+    '{  "turn": "%(turn)s", "move_number": %(move_number)s, "fen": "%(fen)s"'
+    ', "pgn_tail": "%(pgn_tail)s", "last_move_san": "%(last_san)s", "opening": "%(opening)s"'
+    ', "phase": "%(phase)s", "legal_moves_sample": %(sample)s%(avoid)s}'
+)
+# Prompt skeleton with the section headers and fixed instructions joined once at import; the slots are
+# state JSON, strategy guide, threats, eval hints, history summary and the optional safe suggestions
+_PROMPT_TEMPLATE = "\n".join((
+    "=== STATE ===",
+    "%s",
+    "\n=== STRATEGY_GUIDE ===",
+    "%s",
+    "\n=== POSITION_INSIGHTS ===",
+    "Key position insights:",
+    "THREATS: %s",
+    "EVAL_HINTS: %s",
+    "\n=== GAME_HISTORY_SUMMARY ===",
+    "%s",
+    "%s",
+    "\n=== OPTIONS ===",
+    _OPTIONS_INSTRUCTION.replace("%", "%%"),
+    "\n=== PROTOCOL ===",
+    _PROTOCOL_SECTION.replace("%", "%%"),
+))
+
+
+# Opening patterns (top common from Lichess/Chess.com data; UCI format)
+_OPENING_PATTERNS = (
+    (("e2e4", "e7e5", "g1f3", "b8c6", "f1b5"), "Ruy Lopez"),  # Very common vs. e5
+    (("e2e4", "e7e5", "g1f3", "b8c6", "d2d4"), "Scotch Game"),
+    (("e2e4", "e7e5", "g1f3", "b8c6", "f1c4"), "Italian Game"),
+    (("e2e4", "e7e5", "g1f3", "g8f6"), "Petroff Defense"),
+    (("e2e4", "e7e5", "b1c3"), "Vienna Game"),
+    (("e2e4", "e7e5", "d1h5"), "Scholar's Mate Attempt"),  # Common beginner trap
+    (("e2e4", "e7e5"), "King's Pawn Game"),
+    (("e2e4", "c7c5"), "Sicilian Defense"),  # Most popular Black response to e4
+    (("e2e4", "e7e6"), "French Defense"),
+    (("e2e4", "c7c6"), "Caro-Kann Defense"),
+    (("e2e4", "g8f6"), "Alekhine Defense"),
+    (("e2e4", "d7d6"), "Pirc Defense"),
+    (("e2e4", "d7d5"), "Scandinavian Defense"),
+    (("d2d4", "d7d5", "c2c4"), "Queen's Gambit"),
+    (("d2d4", "g8f6", "c2c4", "e7e6", "b1c3", "f8b4"), "Nimzo-Indian Defense"),
+    (("d2d4", "g8f6", "c2c4", "g7g6", "b1c3", "d7d5"), "Grünfeld Defense"),
+    (("d2d4", "g8f6", "c2c4", "g7g6"), "King's Indian Defense"),
+    (("d2d4", "g8f6", "c2c4", "c7c5"), "Benoni Defense"),
+    (("d2d4", "g8f6"), "Indian Defenses (General)"),
+    (("d2d4", "d7d5"), "Queen's Pawn Game"),
+    (("c2c4",), "English Opening"),
+    (("g1f3",), "Réti Opening"),
+    (("d2d4", "f7f5"), "Dutch Defense"),
+    (("f2f4",), "Bird's Opening"),
+    (("b2b4",), "Polish Opening (Sokolsky)"),
+    (("g2g4",), "Grob's Attack"),
+)
+
+
+def _build_opening_index(patterns: tuple) -> tuple[dict, dict, tuple]:
+    """Index opening patterns as a UCI trie plus a (length, move set) table for transposed move orders."""
+    trie: dict = {"name": None, "next": {}}
+    variants: dict = {}
+    for pattern, name in patterns:
+        node = trie
+        for uci in pattern:
+            node = node["next"].setdefault(uci, {"name": None, "next": {}})
+        if node["name"] is None:
+            node["name"] = name
+        variants.setdefault((len(pattern), frozenset(pattern)), name)
+    lengths = tuple(sorted({len(pattern) for pattern, _ in patterns}, reverse=True))
+    return trie, variants, lengths
+
+
+_OPENING_TRIE, _OPENING_VARIANTS, _OPENING_LENGTHS = _build_opening_index(_OPENING_PATTERNS)
+
+
+# Material values in pawn units, indexed by piece type (chess.PAWN..chess.KING)
+_PIECE_VALUE = (0, 1, 3, 3, 5, 9, 0)
+
+# Knight and bishop home squares; a minor piece still on one counts as undeveloped
+_STARTING_MINORS = (chess.BB_B1 | chess.BB_G1 | chess.BB_B8 | chess.BB_G8 |
+                    chess.BB_C1 | chess.BB_F1 | chess.BB_C8 | chess.BB_F8)
+
+# Center squares (d4, d5, e4, e5) counted by _analyze_center_control
+_CENTER = chess.BB_D4 | chess.BB_D5 | chess.BB_E4 | chess.BB_E5
+
+# Piece values for static exchange evaluation, indexed by piece type (king capture ends an exchange)
+_SEE_VALUES = (0, 1, 3, 3, 5, 9, 100)
+
+
+def _material_totals(board: chess.Board) -> tuple[int, int]:
+    """Material of (white, black) in pawn units, counted from the per-type bitboards."""
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
+    white_total = black_total = 0
+    for piece_type, mask in ((chess.PAWN, board.pawns), (chess.KNIGHT, board.knights),
+                             (chess.BISHOP, board.bishops), (chess.ROOK, board.rooks),
+                             (chess.QUEEN, board.queens)):
+        white_total += _PIECE_VALUE[piece_type] * chess.popcount(mask & white)
+        black_total += _PIECE_VALUE[piece_type] * chess.popcount(mask & black)
+    return white_total, black_total
+
+
+class _LegalEntry(NamedTuple):
+    """Legal move data for one position, cached by ChessGame._legal_entry."""
+    key: object
+    moves: List[chess.Move]
+    move_set: frozenset
+    ucis: List[str]
+    by_uci: dict
+
+
+def _captures_first(board: chess.Board, moves: list) -> list:
+    """Reorder moves so captures (en passant included) come first, keeping generation order in each group."""
+    enemy = board.occupied_co[not board.turn]
+    ep_square = board.ep_square
+    captures: list = []
+    quiet: list = []
+    for move in moves:
+        if (chess.BB_SQUARES[move.to_square] & enemy
+                or (move.to_square == ep_square and board.is_en_passant(move))):
+            captures.append(move)
+        else:
+            quiet.append(move)
+    return captures + quiet
+
+
+def _material_won(board: chess.Board, move: chess.Move) -> int:
+    """Material (pawn units) the side to move wins with `move`: the captured piece plus any promotion gain."""
+    if board.is_en_passant(move):
+        won = _PIECE_VALUE[chess.PAWN]
+    else:
+        won = _PIECE_VALUE[board.piece_type_at(move.to_square) or 0]
+    if move.promotion:
+        won += _PIECE_VALUE[move.promotion] - _PIECE_VALUE[chess.PAWN]
+    return won
+
+
+def _may_give_check(board: chess.Board, move: chess.Move, king: Optional[chess.Square]) -> bool:
+    """
+    Cheap filter for moves that could check the enemy king on `king`.
+    
+    A move can only check if it lands on a line or knight jump to the king or opens a line from it;
+    castling and en passant can uncover more, so those always pass. False means it cannot give check.
+    """
+    return bool(king is None
+                or chess.BB_RAYS[move.to_square][king]
+                or chess.BB_KNIGHT_ATTACKS[move.to_square] & chess.BB_SQUARES[king]
+                or chess.BB_RAYS[move.from_square][king]
+                or board.is_castling(move) or board.is_en_passant(move))
+
+
+def _attackers_mask(board: chess.Board, color: chess.Color, square: chess.Square, occupied: int) -> int:
+    """Attackers of `square` by `color` given an occupancy mask, so x-rays appear as pieces are exchanged off."""
+    rank_pieces = chess.BB_RANK_MASKS[square] & occupied
+    file_pieces = chess.BB_FILE_MASKS[square] & occupied
+    diag_pieces = chess.BB_DIAG_MASKS[square] & occupied
+    queens_and_rooks = board.queens | board.rooks
+    queens_and_bishops = board.queens | board.bishops
+    attackers = (
+        (chess.BB_KING_ATTACKS[square] & board.kings) |
+        (chess.BB_KNIGHT_ATTACKS[square] & board.knights) |
+        (chess.BB_RANK_ATTACKS[square][rank_pieces] & queens_and_rooks) |
+        (chess.BB_FILE_ATTACKS[square][file_pieces] & queens_and_rooks) |
+        (chess.BB_DIAG_ATTACKS[square][diag_pieces] & queens_and_bishops) |
+        (chess.BB_PAWN_ATTACKS[not color][square] & board.pawns))
+    return attackers & board.occupied_co[color] & occupied
+
+
+_UCI_PROMOTIONS = {"n": chess.KNIGHT, "b": chess.BISHOP, "r": chess.ROOK, "q": chess.QUEEN}
+
+
+def _parse_plain_uci(uci: str) -> Optional[chess.Move]:
+    """Build a move from a lowercase coordinate string like "e2e4" or "e7e8q", or return None."""
+    if not (4 <= len(uci) <= 5 and 'a' <= uci[0] <= 'h' and '1' <= uci[1] <= '8'
+            and 'a' <= uci[2] <= 'h' and '1' <= uci[3] <= '8' and uci[:2] != uci[2:4]):
+        return None
+    promotion = None
+    if len(uci) == 5:
+        promotion = _UCI_PROMOTIONS.get(uci[4])
+        if promotion is None:
+            return None
+    return chess.Move(chess.square(ord(uci[0]) - 97, ord(uci[1]) - 49),
+                      chess.square(ord(uci[2]) - 97, ord(uci[3]) - 49), promotion=promotion)
+
+
+# Castling summaries keyed by the cleaned rights mask; in standard chess that mask fixes every flag
+_CASTLING_SUMMARIES: dict = {}
+
+
+def _castling_summary(board: chess.Board) -> str:
+    """Castling rights as "W:K1Q1 | B:K0Q0", formatted once per distinct rights mask."""
+    rights = board.clean_castling_rights()
+    summary = None if board.chess960 else _CASTLING_SUMMARIES.get(rights)
+    if summary is None:
+        summary = (f"W:K{int(board.has_kingside_castling_rights(chess.WHITE))}"
+                   f"Q{int(board.has_queenside_castling_rights(chess.WHITE))} | "
+                   f"B:K{int(board.has_kingside_castling_rights(chess.BLACK))}"
+                   f"Q{int(board.has_queenside_castling_rights(chess.BLACK))}")
+        if not board.chess960:
+            _CASTLING_SUMMARIES[rights] = summary
+    return summary
+
 
 class ChessGame(BaseGame):
     """Chess game implementation."""
@@ -38,6 +315,13 @@ class ChessGame(BaseGame):
         
         # For PGN export
         self.moves_san = []
+        self.moves_played: list[chess.Move] = []
+        # PGN Date tag is the day the game started
+        self._game_date = datetime.now().strftime("%Y.%m.%d")
+        # PGN movetext maintained as moves are applied (same 80-column wrapping as chess.pgn.StringExporter)
+        self._pgn_lines: list[str] = []
+        self._pgn_line = ""
+        self._pgn_plies = 0
         # Cache threats for prompt injection
         self._cached_threats_text: Optional[str] = None
         # Per-turn veto tracking to avoid repetition loops
@@ -48,11 +332,26 @@ class ChessGame(BaseGame):
         self._repetition_detected_this_turn: bool = False
         # Last blunder analysis details for feedback
         self._last_blunder_info: Optional[dict] = None
+        # Per-position memo for phase detection and threat text: (position key, value)
+        self._phase_cache: Optional[tuple] = None
+        self._threats_cache: Optional[tuple] = None
+        self._legal_cache: Optional[_LegalEntry] = None
+        self._stats_cache: Optional[tuple] = None
+        self._san_cache: Optional[tuple] = None
+        self._fen_cache: Optional[tuple] = None
+        self._display_cache: Optional[tuple] = None
+        self._threshold_cache: Optional[tuple] = None
+        self._hanging_cache: Optional[tuple] = None
+        # Rendered SAFE_SUGGESTIONS section, reused across retries in the same position
+        self._safe_section_cache: Optional[tuple] = None
+        # Position-dependent prompt sections (guide, insights, history summary)
+        self._prompt_sections_cache: Optional[tuple] = None
+        # Opening name memo keyed on the first 10 plies
+        self._opening_cache: Optional[tuple] = None
     
     def _log_block(self, title: str, lines: list[str]) -> None:
         """Utility to emit a single multi-line debug block to the debug console."""
         try:
-            from debug_console import debug_log
             header = f"\n{'='*80}\n{title}\n{'='*80}"
             body = "\n".join(lines)
             debug_log(f"{header}\n{body}")
@@ -74,27 +373,24 @@ class ChessGame(BaseGame):
             checkers = self._get_checking_pieces() if in_check else []
         except Exception:
             checkers = []
-        castling_before = f"W:K{int(self.board.has_kingside_castling_rights(chess.WHITE))}Q{int(self.board.has_queenside_castling_rights(chess.WHITE))} | B:K{int(self.board.has_kingside_castling_rights(chess.BLACK))}Q{int(self.board.has_queenside_castling_rights(chess.BLACK))}"
+        castling_before = _castling_summary(self.board)
         repetition = self.board.can_claim_threefold_repetition()
         halfmove = self.board.halfmove_clock
-        legal_objs = list(self.board.legal_moves)
+        legal_objs = self._legal_moves_cached()
         total_legal = len(legal_objs)
-        count_captures = sum(1 for m in legal_objs if self.board.is_capture(m))
-        count_checks = 0
-        count_promos = 0
-        count_castles = 0
+        board = self.board
+        count_captures = sum(1 for m in legal_objs if board.is_capture(m))
+        # Checks, promotions and castles over the first 100 moves; gives_check is a push/pop, so only
+        # moves that pass the cheap ray/knight filter pay for it
+        king = board.king(not board.turn)
+        count_checks = count_promos = count_castles = 0
         for m in legal_objs[:100]:
-            try:
-                if m.promotion:
-                    count_promos += 1
-                if self.board.is_castling(m):
-                    count_castles += 1
-                self.board.push(m)
-                if self.board.is_check():
-                    count_checks += 1
-                self.board.pop()
-            except Exception:
-                pass
+            if m.promotion:
+                count_promos += 1
+            elif board.is_castling(m):
+                count_castles += 1
+            if _may_give_check(board, m, king) and board.gives_check(m):
+                count_checks += 1
         attempt_num = getattr(self, '_attempt_num', 0)
         attempt_max = getattr(self, '_attempt_max', 0)
         lines.append(f"Turn: {move_number}, Player: {player_name} ({color_name}), Turn ID: {getattr(self, '_turn_id', '')}, Attempt: {attempt_num}/{attempt_max}")
@@ -118,7 +414,6 @@ class ChessGame(BaseGame):
         self._log_block("TURN CONTEXT", lines)
         # JSON mirror payload for analytics
         try:
-            from debug_console import debug_log
             payload = {
                 "turn": move_number,
                 "turn_id": getattr(self, "_turn_id", ""),
@@ -154,15 +449,56 @@ class ChessGame(BaseGame):
     
     def get_state_text(self) -> str:
         """Return FEN representation of the current board state."""
-        return self.board.fen()
+        # FEN also carries the move counters, which the position key leaves out
+        board = self.board
+        key = (board._transposition_key(), board.halfmove_clock, board.fullmove_number)
+        if self._fen_cache is None or self._fen_cache[0] != key:
+            self._fen_cache = (key, board.fen())
+        return self._fen_cache[1]
     
     def get_state_display(self) -> str:
         """Return a human-readable display of the current board."""
-        return str(self.board)
+        key = self.board._transposition_key()
+        if self._display_cache is None or self._display_cache[0] != key:
+            self._display_cache = (key, str(self.board))
+        return self._display_cache[1]
     
     def get_legal_actions(self) -> List[str]:
         """Return list of legal moves in UCI notation."""
-        return [str(move) for move in self.board.legal_moves]
+        return list(self._legal_entry().ucis)
+    
+    def _legal_moves_cached(self) -> List[chess.Move]:
+        """Return the legal Move objects for the current position, generated once per position."""
+        return self._legal_entry().moves
+
+    def _is_legal_cached(self, move: chess.Move) -> bool:
+        """Check legality with a hash lookup in the current position's legal move set."""
+        return move in self._legal_entry().move_set
+
+    def _legal_entry(self) -> _LegalEntry:
+        """
+        Legal move data for the current position, built once per position.
+        
+        Returns:
+            _LegalEntry: position key, legal move list and set, UCI strings and a {uci: move} map
+        """
+        key = self.board._transposition_key()
+        if self._legal_cache is None or self._legal_cache.key != key:
+            moves = list(self.board.legal_moves)
+            ucis = [move.uci() for move in moves]
+            self._legal_cache = _LegalEntry(key, moves, frozenset(moves), ucis, dict(zip(ucis, moves)))
+        return self._legal_cache
+
+    def _san_cached(self, move: chess.Move) -> str:
+        """Return SAN for a legal move, converting each move at most once per position."""
+        key = self.board._transposition_key()
+        if self._san_cache is None or self._san_cache[0] != key:
+            self._san_cache = (key, {})
+        sans = self._san_cache[1]
+        san = sans.get(move)
+        if san is None:
+            san = sans[move] = self.board.san(move)
+        return san
     
     def is_game_over(self) -> bool:
         """Check if the chess game is over."""
@@ -218,19 +554,22 @@ class ChessGame(BaseGame):
             action = action.strip()
             
             # Try to parse as UCI move first (UCI should be lowercase)
-            move = None
+            # Legal UCI strings map straight to their cached Move; anything else is parsed below
+            move = self._legal_entry().by_uci.get(action.lower())
             try:
-                move = chess.Move.from_uci(action.lower())
-                print(f"DEBUG: Successfully parsed UCI move: {action.lower()} -> {move}")
+                # Plain coordinate moves skip from_uci; anything else (null/drop notation) still goes through it
+                if move is None:
+                    move = _parse_plain_uci(action.lower()) or chess.Move.from_uci(action.lower())
+                logger.debug("Successfully parsed UCI move: %s -> %s", action.lower(), move)
             except (ValueError, chess.InvalidMoveError):
                 # If UCI parsing fails, try algebraic notation (preserve case)
                 try:
-                    print(f"DEBUG: Trying to parse algebraic notation: {action}")
+                    logger.debug("Trying to parse algebraic notation: %s", action)
                     # Convert algebraic to move object (case-sensitive)
                     move = self.board.parse_san(action)
-                    print(f"DEBUG: Successfully parsed algebraic move: {action} -> {move}")
+                    logger.debug("Successfully parsed algebraic move: %s -> %s", action, move)
                 except (ValueError, chess.InvalidMoveError, chess.IllegalMoveError) as e:
-                    print(f"DEBUG: Failed to parse algebraic notation {action}: {e}")
+                    logger.debug("Failed to parse algebraic notation %s: %s", action, e)
                     try:
                         self._last_failure_reason[self.current_player] = f"Could not parse move '{action}'"
                     except Exception:
@@ -238,25 +577,27 @@ class ChessGame(BaseGame):
                     return False
             
             if move is None:
-                print(f"DEBUG: Could not parse move: {action}")
+                logger.debug("Could not parse move: %s", action)
                 return False
             
             # Debug logging
-            legal_list = list(self.board.legal_moves)
-            print(f"DEBUG: Attempting move {action} for {self.current_player}")
-            print(f"DEBUG: Current turn: {'White' if self.board.turn == chess.WHITE else 'Black'}")
-            print(f"DEBUG: Move legal: {move in legal_list}")
-            print(f"DEBUG: Legal moves: {[str(m) for m in legal_list[:10]]}...")
+            # Generate legal moves once (shared per position) and test membership once
+            legal_list = self._legal_moves_cached()
+            move_is_legal = self._is_legal_cached(move)
+            logger.debug("Attempting move %s for %s", action, self.current_player)
+            logger.debug("Current turn: %s", 'White' if self.board.turn == chess.WHITE else 'Black')
+            logger.debug("Move legal: %s", move_is_legal)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Legal moves: %s...", [str(m) for m in legal_list[:10]])
             
             try:
-                from debug_console import debug_log
-                debug_log(f"Chess: Attempting {action} for {self.current_player}")
-                debug_log(f"Chess: Turn={'White' if self.board.turn == chess.WHITE else 'Black'}, Legal={move in self.board.legal_moves}")
+                debug_log(f"Chess: Attempting {action} for {self.current_player}\n"
+                          f"Chess: Turn={'White' if self.board.turn == chess.WHITE else 'Black'}, Legal={move_is_legal}")
             except:
                 pass
             
             # Optional lightweight blunder check before applying
-            if move in legal_list:
+            if move_is_legal:
                 # Skip blunder veto if there is only one legal move or if a forced-apply flag is set (e.g., emergency fallback)
                 skip_blunder = False
                 try:
@@ -266,7 +607,7 @@ class ChessGame(BaseGame):
                 except Exception:
                     skip_blunder = False
                 if len(legal_list) > 1 and not skip_blunder and self._would_be_gross_blunder(move):
-                    print("DEBUG: Potential blunder detected; rejecting move for retry")
+                    logger.debug("Potential blunder detected; rejecting move for retry")
                     try:
                         # Compose detailed failure message
                         detail = ""
@@ -292,20 +633,24 @@ class ChessGame(BaseGame):
                         pass
                     return False
                 # Store move in SAN notation for PGN
-                san_move = self.board.san(move)
+                san_move = self._san_cached(move)
                 self.moves_san.append(san_move)
+                self._record_pgn_move(san_move)
                 # Pre-move context for logging
                 prev_fullmove = self.board.fullmove_number
                 mover_color = 'White' if self.board.turn == chess.WHITE else 'Black'
                 uci_move = move.uci()
                 was_capture = self.board.is_capture(move)
-                baseline_eval = self._evaluate_material(self.board, self.board.turn)
-                moved_piece = self.board.piece_at(move.from_square).symbol() if self.board.piece_at(move.from_square) else '?'
+                # Mover's material change follows from the move: captured piece plus promotion gain
+                material_delta = _material_won(self.board, move)
+                moved = self.board.piece_at(move.from_square)
+                moved_piece = moved.symbol() if moved else '?'
                 captured_piece = None
                 # Start apply timer before pushing the move
                 apply_start = time.perf_counter()
                 # Apply the move
                 self.board.push(move)
+                self.moves_played.append(move)
                 try:
                     # If capture, the captured piece type can be inferred by SAN or prior board state; using SAN marker 'x'
                     if 'x' in san_move:
@@ -313,17 +658,17 @@ class ChessGame(BaseGame):
                 except Exception:
                     pass
                 after_check = self.board.is_check()
-                after_eval = self._evaluate_material(self.board, not self.board.turn)  # same perspective as mover
-                material_delta = after_eval - baseline_eval
-                after_fen = self.board.fen()
-                reply_count = len(list(self.board.legal_moves))
-                is_mate = self.board.is_checkmate()
-                is_stalemate = self.board.is_stalemate()
-                castling_after = f"W:K{int(self.board.has_kingside_castling_rights(chess.WHITE))}Q{int(self.board.has_queenside_castling_rights(chess.WHITE))} | B:K{int(self.board.has_kingside_castling_rights(chess.BLACK))}Q{int(self.board.has_queenside_castling_rights(chess.BLACK))}"
+                after_fen = self.get_state_text()
+                # The opponent's legal moves are needed next turn anyway, so count them through the cache;
+                # with no replies, check decides between mate and stalemate
+                reply_count = len(self._legal_moves_cached())
+                is_mate = after_check and reply_count == 0
+                is_stalemate = not after_check and reply_count == 0
+                castling_after = _castling_summary(self.board)
                 # Use one decimal ms; minimum 0.1 ms to avoid showing 0
                 apply_ms_val = (time.perf_counter() - apply_start) * 1000.0
                 apply_ms = max(0.1, round(apply_ms_val, 1))
-                print(f"DEBUG: Move {action} applied successfully")
+                logger.debug("Move %s applied successfully", action)
                 # Expose move metadata for logger
                 try:
                     self._last_move_metadata = {
@@ -360,7 +705,7 @@ class ChessGame(BaseGame):
                     pass
                 return True
             else:
-                print(f"DEBUG: Move {action} is not legal in current position")
+                logger.debug("Move %s is not legal in current position", action)
                 try:
                     self._last_failure_reason[self.current_player] = f"Move '{action}' is not legal in this position"
                     # Expose invalid attempt metadata
@@ -373,7 +718,7 @@ class ChessGame(BaseGame):
                 return False
                 
         except (ValueError, chess.InvalidMoveError) as e:
-            print(f"DEBUG: Invalid move format {action}: {e}")
+            logger.debug("Invalid move format %s: %s", action, e)
             return False
     
     def get_prompt(self) -> str:
@@ -384,8 +729,8 @@ class ChessGame(BaseGame):
 
         # Log player and board turn
         board_turn = "White" if self.board.turn == chess.WHITE else "Black"
-        print(f"DEBUG: Player {self.current_player} ({color_name}) requesting move")
-        print(f"DEBUG: Board expects {board_turn} to move")
+        logger.debug("Player %s (%s) requesting move", self.current_player, color_name)
+        logger.debug("Board expects %s to move", board_turn)
 
         # Core state
         current_fen = self.get_state_text()
@@ -397,31 +742,14 @@ class ChessGame(BaseGame):
         phase, phase_info = self.detect_game_phase()
         opening_name = self.recognize_opening()
 
-        # Strategy guide per phase
-        if phase == 'opening':
-            strategy_guide = (
-                "Opening principles: Develop pieces quickly, control the center (e4/d4/e5/d5), "
-                "ensure king safety (consider castling), and avoid early queen sorties or loose pawn moves."
-            )
-        elif phase == 'endgame':
-            strategy_guide = (
-                "Endgame principles: Activate the king, create and push passed pawns, "
-                "use opposition and triangulation, and avoid stalemate tricks."
-            )
+        # Guide, insights and history summary depend only on the position and opening; retries reuse them
+        sections_key = (self.board._transposition_key(), move_number, opening_name)
+        if self._prompt_sections_cache is not None and self._prompt_sections_cache[0] == sections_key:
+            sections = self._prompt_sections_cache[1]
         else:
-            strategy_guide = (
-                "Middlegame principles: Improve worst-placed piece, coordinate forces, "
-                "calculate tactics (pins, forks, discovered attacks), and evaluate trades."
-            )
-        if self.board.is_check():
-            strategy_guide += " You are in check: consider only moves that resolve the check (block, capture, or move the king)."
-
-        # Position insights
-        threats_text = self.get_threats()
-        analysis = self.get_position_analysis()
-        mat_balance = analysis.get("material_balance", {}).get("balance", 0)
-        center = analysis.get("center_control", {})
-        center_summary = f"center control W:{center.get('white_center_control', 0)} B:{center.get('black_center_control', 0)}"
+            sections = self._prompt_sections(phase, phase_info, opening_name)
+            self._prompt_sections_cache = (sections_key, sections)
+        guide_section, threats_text, eval_hints, history_summary = sections
 
         # Legal moves sampling (always provide subset; expand sample after veto)
         all_legal_uci: list[str] = self.get_legal_actions()
@@ -460,11 +788,6 @@ class ChessGame(BaseGame):
         except Exception:
             previous_feedback = ""
 
-        # One-line history summary
-        mat_tag = f"material {'+' if mat_balance>0 else ''}{mat_balance}" if mat_balance != 0 else "material equal"
-        dev = phase_info.get('developed_pieces', None)
-        history_summary = f"Phase: {phase}; Opening: {opening_name}; {mat_tag}; developed_pieces={dev}"
-
         # Turn context debug block
         try:
             veto_text = ", ".join(avoid_moves[:5]) if avoid_moves else ""
@@ -485,84 +808,77 @@ class ChessGame(BaseGame):
             pass
 
         # Build structured prompt
-        state_json_lines = [
-            "{",
-            f"  \"turn\": \"{board_turn}\"",
-            f", \"move_number\": {move_number}",
-            f", \"fen\": \"{current_fen}\"",
-            f", \"pgn_tail\": \"{pgn_tail.replace('\\', '\\\\').replace('\"', '\\\"')}\"",
-            f", \"last_move_san\": \"{last_san.replace('\\', '\\\\').replace('\"', '\\\"')}\"",
-            f", \"opening\": \"{opening_name}\"",
-            f", \"phase\": \"{phase}\"",
-            f", \"legal_moves_sample\": {json.dumps(shown_moves)}",
-        ]
-        if avoid_moves:
-            state_json_lines.append(f", \"avoid_moves\": {json.dumps(avoid_moves)}")
-        state_json_lines.append("}")
-
-        guide_section = (
-            "Consider the following strategy guide for this phase:\n"
-            f"- {strategy_guide}\n"
-            "- Prefer moves that improve piece activity and king safety.\n"
-            "- Calculate 1-2 moves ahead for opponent replies to avoid blunders."
-        )
-
-        insights_section = (
-            "Key position insights:\n"
-            f"THREATS: {threats_text}\n"
-            f"EVAL_HINTS: {mat_tag}; {center_summary}"
-        )
-
-        previous_section = (f"Previous attempt feedback: {previous_feedback}\n" if previous_feedback else "")
+        state_json = _STATE_JSON_TEMPLATE % {
+            "turn": board_turn,
+            "move_number": move_number,
+            "fen": current_fen,
+            "pgn_tail": pgn_tail.replace('\\', '\\\\').replace('"', '\\"'),
+            "last_san": last_san.replace('\\', '\\\\').replace('"', '\\"'),
+            "opening": opening_name,
+            "phase": phase,
+            "sample": json.dumps(shown_moves),
+            "avoid": ', "avoid_moves": ' + json.dumps(avoid_moves) if avoid_moves else "",
+        }
 
         # Safe suggestions after a veto or explicit failure feedback
-        safe_suggestions: list[str] = []
+        safe_section = ""
         if prior_veto:
-            try:
-                safe_suggestions = self.get_safe_candidates(limit=3)
-            except Exception:
-                safe_suggestions = []
-
-        options_instruction = (
-            "Choose your move from the provided legal move sample or propose another move if you believe it is superior, "
-            "but ensure it is legal in the current position. Prefer SAN or UCI. If uncertain, consider SAFE_SUGGESTIONS."
-        )
-
-        protocol_section = (
-            "Respond with exactly two lines:\n"
-            "REASONING: <concise step-by-step analysis>\n"
-            "MOVE: <SAN or UCI>"
-        )
+            safe_key = self.board._transposition_key()
+            if self._safe_section_cache is not None and self._safe_section_cache[0] == safe_key:
+                safe_section = self._safe_section_cache[1]
+            else:
+                try:
+                    safe_suggestions = self.get_safe_candidates(limit=3)
+                except Exception:
+                    safe_suggestions = []
+                if safe_suggestions:
+                    safe_section = "\n=== SAFE_SUGGESTIONS ===\n" + ", ".join(safe_suggestions)
+                self._safe_section_cache = (safe_key, safe_section)
 
-        prompt_parts = [
-            "=== STATE ===",
-            "".join(state_json_lines),
-            "\n=== STRATEGY_GUIDE ===",
+        final_prompt = _PROMPT_TEMPLATE % (
+            state_json,
             guide_section,
-            "\n=== POSITION_INSIGHTS ===",
-            insights_section,
-            "\n=== GAME_HISTORY_SUMMARY ===",
+            threats_text,
+            eval_hints,
             history_summary,
-            ("\n=== SAFE_SUGGESTIONS ===\n" + ", ".join(safe_suggestions)) if safe_suggestions else "",
-            "\n=== OPTIONS ===",
-            options_instruction,
-            "\n=== PROTOCOL ===",
-            protocol_section,
-        ]
-
-        final_prompt = "\n".join(prompt_parts)
+            safe_section,
+        )
 
         # Debug metrics
         try:
-            from debug_console import debug_log
             build_ms = int((time.time() - prompt_start) * 1000)
             debug_log(f"Structured Prompt: len={len(final_prompt)} chars, build_ms={build_ms}, shown_moves={len(shown_moves)}")
-            print(f"DEBUG: Structured prompt total length: {len(final_prompt)} characters")
+            logger.debug("Structured prompt total length: %d characters", len(final_prompt))
         except Exception:
             pass
 
         return final_prompt
 
+    def _prompt_sections(self, phase: str, phase_info: dict, opening_name: str) -> tuple[str, str, str, str]:
+        """
+        Render the position-dependent prompt sections.
+        
+        Returns:
+            tuple: (strategy guide, threats text, eval hints, history summary)
+        """
+        # Strategy guide per phase (prebuilt; unknown phases fall back to middlegame)
+        in_check = self.board.is_check()
+        guide_section = _GUIDE_SECTIONS.get((phase, in_check)) or _GUIDE_SECTIONS[('middlegame', in_check)]
+
+        # Position insights
+        threats_text = self.get_threats()
+        # Only the material and center summaries feed the prompt; skip the mobility move generation
+        analysis = self.get_position_analysis({"material_balance", "center_control"})
+        mat_balance = analysis.get("material_balance", {}).get("balance", 0)
+        center = analysis.get("center_control", {})
+        center_summary = f"center control W:{center.get('white_center_control', 0)} B:{center.get('black_center_control', 0)}"
+
+        # One-line history summary
+        mat_tag = f"material {mat_balance:+d}" if mat_balance != 0 else "material equal"
+        dev = phase_info.get('developed_pieces', None)
+        history_summary = f"Phase: {phase}; Opening: {opening_name}; {mat_tag}; developed_pieces={dev}"
+        return guide_section, threats_text, f"{mat_tag}; {center_summary}", history_summary
+
     def reconcile_turn(self) -> None:
         """Ensure current_player matches board.turn. Do not modify board; only sync current_player_index."""
         try:
@@ -571,11 +887,11 @@ class ChessGame(BaseGame):
             for idx, name in enumerate(self.player_list):
                 if self.player_colors.get(name) == board_color:
                     if self.current_player_index != idx:
-                        print(f"DEBUG: Reconciling turn: switching current player from {self.current_player} to {name}")
+                        logger.debug("Reconciling turn: switching current player from %s to %s", self.current_player, name)
                         self.current_player_index = idx
                     break
         except Exception as e:
-            print(f"DEBUG: reconcile_turn failed: {e}")
+            logger.debug("reconcile_turn failed: %s", e)
     
     def start_turn_setup(self) -> None:
         """Reset per-turn state before prompting the model."""
@@ -610,31 +926,43 @@ class ChessGame(BaseGame):
     
     def parse_action_from_response(self, response: str) -> Optional[str]:
         """Parse a move from the AI's response with a strict MOVE/JSON contract and extensive debugging."""
-        print("\n" + "="*80)
-        print("🔍 MOVE VALIDATION DEBUG - DETAILED ANALYSIS")
-        print("="*80)
+        logger.debug("MOVE VALIDATION DEBUG - DETAILED ANALYSIS")
         
         # Soft-check for candidates: don't reject outright if a legal move is provided
         try:
-            has_candidates = bool(re.search(r"CANDIDATES\s*:|Candidates\s*:|candidates\s*:", response))
+            has_candidates = bool(_CANDIDATES_RE.search(response))
         except Exception:
             has_candidates = True
         
         # Step 1: Strict extraction from JSON or MOVE: line
         parsed_move: Optional[str] = None
         raw_move: Optional[str] = None
-        print(f"📝 AI Response (first 200 chars): {response[:200]}...")
+        logger.debug("AI Response (first 200 chars): %s...", response[:200])
         parse_start = time.time()
         # Contract/compliance flags
         try:
             first_line = response.splitlines()[0].strip() if response else ""
-            first_line_is_move = bool(re.match(r"^(MOVE\s*:|\{\s*\"?move\"?\s*:)", first_line, re.IGNORECASE))
+            first_line_is_move = bool(_FIRST_LINE_MOVE_RE.match(first_line))
         except Exception:
             first_line_is_move = False
         
+        # Happy path: "MOVE: <uci>" on the first line with no other move marker in the rest means
+        # neither the JSON form nor a later MOVE: line can override it, so skip the extraction cascade
+        head, _, rest = response.partition("\n")
+        fast_line = _FAST_UCI_LINE_RE.fullmatch(head)
+        if fast_line and "move" not in rest.lower():
+            fast_uci = fast_line.group(1)
+            fast_move = self._legal_entry().by_uci.get(fast_uci)
+            if fast_move is not None:
+                logger.debug("UCI happy path: %s is legal", fast_move)
+                candidates = self._extract_candidates(response, self._legal_moves_cached())
+                self._log_parse_success(response, fast_uci, fast_move, "UCI", parse_start,
+                                        first_line_is_move, has_candidates, candidates)
+                return fast_uci
+        
         # 1a) Try to extract JSON {"move":"..."}
         try:
-            json_match = re.search(r"\{\s*\"?move\"?\s*:\s*\"([^\"]+)\"\s*\}", response, re.IGNORECASE)
+            json_match = _JSON_MOVE_RE.search(response)
             if json_match:
                 raw_move = json_match.group(1)
         except Exception:
@@ -643,7 +971,7 @@ class ChessGame(BaseGame):
         # 1b) If not found, look for the last MOVE: occurrence, accepting optional brackets
         if not raw_move:
             try:
-                move_matches = list(re.finditer(r"(?is)MOVE\s*:\s*(?:\[\s*)?(.+?)(?:\s*\]|\s*REASONING\s*:|\n|\r|$)", response, re.IGNORECASE))
+                move_matches = list(_MOVE_LINE_RE.finditer(response))
                 if move_matches:
                     raw_move = move_matches[-1].group(1)
             except Exception:
@@ -654,69 +982,53 @@ class ChessGame(BaseGame):
             candidate = raw_move.strip()
             candidate = candidate.strip('`* ').strip()
             # Remove trailing punctuation that sometimes appears
-            candidate = re.sub(r"[\.;,:]+$", "", candidate)
+            candidate = _TRAIL_PUNCT_RE.sub("", candidate)
             # Collapse extra spaces
-            candidate = re.sub(r"\s+", " ", candidate)
+            candidate = _WS_RE.sub(" ", candidate)
             # Some authors put the move in brackets like [Qxc5+]
             candidate = candidate.strip('[]')
             raw_move = candidate
-            print(f"🎯 Extracted raw move from contract: '{raw_move}'")
+            logger.debug("Extracted raw move from contract: '%s'", raw_move)
         else:
-            print("❌ No MOVE or JSON move found in response")
+            logger.debug("No MOVE or JSON move found in response")
         
         # Step 1c: Reject bare-square tokens like "h5" / "e1"
-        if raw_move and re.fullmatch(r"[a-h][1-8]", raw_move.strip(), flags=re.IGNORECASE):
-            print(f"❌ Rejected bare-square token as move: '{raw_move}'")
+        if raw_move and _BARE_SQUARE_RE.fullmatch(raw_move.strip()):
+            logger.debug("Rejected bare-square token as move: '%s'", raw_move)
             raw_move = None
         
         # Step 1d: If still None, attempt a conservative fallback by scanning for any legal token later
         parsed_move = raw_move
         
-        print(f"🎯 Parsed move from AI: '{parsed_move}'")
+        logger.debug("Parsed move from AI: '%s'", parsed_move)
         
         # Step 2: Get current board state
-        current_fen = self.board.fen()
+        current_fen = self.get_state_text()
         current_turn = "White" if self.board.turn else "Black"
-        print(f"♟️  Current board FEN: {current_fen}")
-        print(f"🔄 Current turn: {current_turn}")
-        
-        # Step 3: Get ALL legal moves in multiple formats
-        legal_moves_objects = list(self.board.legal_moves)
-        legal_moves_uci = [str(move) for move in legal_moves_objects]
-        legal_moves_san = []
-        
-        print(f"\n📋 LEGAL MOVES ANALYSIS:")
-        print(f"   Total legal moves: {len(legal_moves_objects)}")
-        print(f"   UCI format: {legal_moves_uci}")
-        
-        # Generate SAN (algebraic) for each legal move
-        for move_obj in legal_moves_objects:
-            try:
-                san = self.board.san(move_obj)
-                legal_moves_san.append(san)
-            except Exception as e:
-                print(f"   ⚠️  Error converting {move_obj} to SAN: {e}")
-        
-        print(f"   SAN format: {legal_moves_san}")
-        print(f"   SAN lowercase: {[san.lower() for san in legal_moves_san]}")
-        # Candidate extraction (best-effort from response text)
-        candidates: list[str] = []
-        try:
-            scope = response
-            cand_section = re.search(r"CANDIDATES\s*:\s*([\s\S]+?)(?:\n\s*(MOVE\s*:|REASONING\s*:)|$)", response, re.IGNORECASE)
-            if cand_section:
-                scope = cand_section.group(1)
-            seen = set()
-            for san in legal_moves_san:
-                if san in seen:
-                    continue
-                if re.search(rf"(?<![A-Za-z0-9_]){re.escape(san)}(?![A-Za-z0-9_])", scope):
-                    candidates.append(san)
-                    seen.add(san)
-                    if len(candidates) >= 3:
-                        break
-        except Exception:
-            candidates = []
+        logger.debug("Current board FEN: %s", current_fen)
+        logger.debug("Current turn: %s", current_turn)
+        
+        # Step 3: Get ALL legal moves (objects, UCI strings and UCI lookup share one per-position cache)
+        legal_entry = self._legal_entry()
+        legal_moves_objects = legal_entry.moves
+        legal_moves_uci = legal_entry.ucis
+        legal_by_uci = legal_entry.by_uci
+        
+        # Fast path: a clean UCI move that is legal here needs neither the SAN list nor the parser cascade
+        fast_move = _parse_plain_uci(parsed_move) if parsed_move else None
+        if fast_move is not None and self._is_legal_cached(fast_move):
+            logger.debug("UCI fast path: %s is legal", fast_move)
+            candidates = self._extract_candidates(response, legal_moves_objects)
+            self._log_parse_success(response, parsed_move, fast_move, "UCI", parse_start,
+                                    first_line_is_move, has_candidates, candidates)
+            return parsed_move
+        
+        logger.debug("Legal moves: total=%d, UCI=%s", len(legal_moves_objects), legal_moves_uci)
+        
+        moves_by_san = self._mentioned_legal_san(legal_moves_objects, response)
+        legal_moves_san = list(moves_by_san)
+        logger.debug("Legal moves SAN (mentioned in response): %s", legal_moves_san)
+        candidates = self._extract_candidates(response, legal_moves_objects, legal_moves_san)
         
         # Step 4: Test the parsed move against legal moves
         if not parsed_move:
@@ -725,20 +1037,25 @@ class ChessGame(BaseGame):
                 # prefer SAN tokens with symbols like +/# which are less ambiguous
                 san_tokens = sorted(legal_moves_san, key=lambda s: (0 if ('+' in s or '#' in s) else 1, -len(s)))
                 for tok in san_tokens:
-                    if re.search(rf"(?<![A-Za-z0-9_]){re.escape(tok)}(?![A-Za-z0-9_])", response):
+                    if _san_token_re(tok).search(response):
                         parsed_move = tok
-                        print(f"✅ Fallback found SAN token in response: '{parsed_move}'")
+                        logger.debug("Fallback found SAN token in response: '%s'", parsed_move)
                         break
                 if not parsed_move:
+                    # Collect every UCI-shaped substring in one scan (with and without a promotion letter)
+                    uci_found = set()
+                    for tok in _UCI_TOKEN_RE.findall(response):
+                        uci_found.add(tok)
+                        uci_found.add(tok[:4])
                     for tok in legal_moves_uci:
-                        if tok in response:
+                        if tok in uci_found:
                             parsed_move = tok
-                            print(f"✅ Fallback found UCI token in response: '{parsed_move}'")
+                            logger.debug("Fallback found UCI token in response: '%s'", parsed_move)
                             break
             except Exception:
                 pass
         if not parsed_move:
-            print(f"❌ VALIDATION FAILED: No move could be parsed from AI response")
+            logger.debug("VALIDATION FAILED: No move could be parsed from AI response")
             try:
                 if not hasattr(self, '_last_failure_reason'):
                     self._last_failure_reason = {}
@@ -756,109 +1073,74 @@ class ChessGame(BaseGame):
             ])
             return None
             
-        print(f"\n🔍 TESTING PARSED MOVE: '{parsed_move}'")
-        
-        # Test exact matches
-        uci_match = parsed_move in legal_moves_uci
-        san_exact_match = parsed_move in legal_moves_san
-        san_lower_match = parsed_move.lower() in [san.lower() for san in legal_moves_san]
+        logger.debug("Testing parsed move: '%s'", parsed_move)
+        parsed_lower = parsed_move.lower()
         
-        print(f"   ✓ UCI exact match: {uci_match}")
-        print(f"   ✓ SAN exact match: {san_exact_match}")
-        print(f"   ✓ SAN lowercase match: {san_lower_match}")
+        # Test exact matches (diagnostic only)
+        if logger.isEnabledFor(logging.DEBUG):
+            uci_match = parsed_move in legal_by_uci
+            san_exact_match = parsed_move in legal_moves_san
+            san_lower_match = parsed_lower in {san.lower() for san in legal_moves_san}
+            logger.debug("UCI exact match: %s, SAN exact match: %s, SAN lowercase match: %s", uci_match, san_exact_match, san_lower_match)
         
         # Step 5: Try to parse the move with python-chess
         move_obj = None
         parsing_method = None
         
-        # Try SAN first (accepts symbols like +/# and castling notation)
-        try:
-            move_obj = self.board.parse_san(parsed_move)
+        # A move spelled exactly as a legal SAN resolves without the parser; any legal SAN the
+        # response contains is in moves_by_san, since its destination square appears in the text
+        move_obj = moves_by_san.get(parsed_move)
+        if move_obj is not None:
             parsing_method = "SAN"
-            print(f"   ✅ SAN parsing successful: {move_obj}")
-        except Exception as e:
-            print(f"   ❌ SAN parsing failed: {e}")
+            logger.debug("SAN matched legal move: %s", move_obj)
+        else:
+            # Try SAN first (accepts symbols like +/# and castling notation)
+            try:
+                move_obj = self.board.parse_san(parsed_move)
+                parsing_method = "SAN"
+                logger.debug("SAN parsing successful: %s", move_obj)
+            except Exception as e:
+                logger.debug("SAN parsing failed: %s", e)
         
         # Try UCI parsing if SAN failed, but only if format looks like UCI
         if move_obj is None:
-            looks_like_uci = bool(re.fullmatch(r"[a-h][1-8][a-h][1-8][nbrqNBRQ]?", parsed_move))
+            looks_like_uci = bool(_UCI_SHAPE_RE.fullmatch(parsed_move))
             if looks_like_uci:
-                try:
-                    move_obj = chess.Move.from_uci(parsed_move.lower())
+                # The shape check already holds, so build the move directly instead of via from_uci
+                move_obj = _parse_plain_uci(parsed_lower)
+                if move_obj is not None:
                     parsing_method = "UCI"
-                    print(f"   ✅ UCI parsing successful: {move_obj}")
-                except Exception as e:
-                    print(f"   ❌ UCI parsing failed: {e}")
-        
-        # Try SAN parsing if UCI failed
-        if move_obj is None:
-            try:
-                move_obj = self.board.parse_san(parsed_move)
-                parsing_method = "SAN"
-                print(f"   ✅ SAN parsing successful: {move_obj}")
-            except Exception as e:
-                print(f"   ❌ SAN parsing failed: {e}")
+                    logger.debug("UCI parsing successful: %s", move_obj)
+                else:
+                    logger.debug("UCI parsing failed: %s", parsed_move)
         
-        # Try SAN parsing with capitalization fixes
+        # Try SAN parsing with capitalization fixes; parse_san is deterministic for a position,
+        # so spellings that were already tried are skipped rather than parsed again
         if move_obj is None:
-            for variation in [parsed_move.capitalize(), parsed_move.upper()]:
+            tried = {parsed_move}
+            for variation in (parsed_move.capitalize(), parsed_move.upper()):
+                if variation in tried:
+                    continue
+                tried.add(variation)
                 try:
                     move_obj = self.board.parse_san(variation)
                     parsing_method = f"SAN ({variation})"
-                    print(f"   ✅ SAN parsing successful with '{variation}': {move_obj}")
+                    logger.debug("SAN parsing successful with '%s': %s", variation, move_obj)
                     break
                 except Exception as e:
-                    print(f"   ❌ SAN parsing with '{variation}' failed: {e}")
+                    logger.debug("SAN parsing with '%s' failed: %s", variation, e)
         
         # Step 6: Check if parsed move is actually legal
         if move_obj:
-            is_legal = move_obj in self.board.legal_moves
-            print(f"   ✅ Move object created via {parsing_method}: {move_obj}")
-            print(f"   ✅ Move is legal on board: {is_legal}")
+            is_legal = self._is_legal_cached(move_obj)
+            logger.debug("Move object created via %s: %s (legal on board: %s)", parsing_method, move_obj, is_legal)
             
             if is_legal:
-                parse_ms = int((time.time() - parse_start) * 1000)
-                print(f"🎉 VALIDATION SUCCESS: Move '{parsed_move}' is valid!")
-                try:
-                    from debug_console import debug_log
-                    # Reasoning length
-                    reasoning_chars = 0
-                    try:
-                        m = re.search(r"REASONING\s*:\s*([\s\S]+)$", response, re.IGNORECASE)
-                        if m:
-                            reasoning_chars = len(m.group(1).strip())
-                    except Exception:
-                        pass
-                    debug_log(f"VALIDATION SUCCESS: {parsed_move} -> {move_obj}; parse_ms={parse_ms}; first_line_is_move={first_line_is_move}; has_candidates={has_candidates}; reasoning_chars={reasoning_chars}; candidates={candidates}")
-                    # JSON mirror
-                    payload = {
-                        "turn": self.board.fullmove_number,
-                        "player": self.current_player,
-                        "proposed": parsed_move,
-                        "parsed_via": parsing_method,
-                        "legal": True,
-                        "parse_ms": parse_ms,
-                        "first_line_is_move": first_line_is_move,
-                        "has_candidates": bool(has_candidates),
-                        "candidates": candidates,
-                    }
-                    debug_log(f"MOVE_VALIDATION_JSON: {json.dumps(payload, ensure_ascii=False)}")
-                except:
-                    pass
-                # Emit a compact summary block for this validation
-                self._log_block("MOVE VALIDATION DETAILS", [
-                    f"Turn: {self.board.fullmove_number}",
-                    f"Player: {self.current_player}",
-                    f"Proposed: {parsed_move} (parsed via {parsing_method})",
-                    f"Legal: True",
-                    f"Contract: first_line_is_move={first_line_is_move}, has_candidates={has_candidates}",
-                    f"Candidates: {', '.join(candidates) if candidates else 'n/a'}",
-                    f"Parse ms: {parse_ms}",
-                ])
+                self._log_parse_success(response, parsed_move, move_obj, parsing_method, parse_start,
+                                        first_line_is_move, has_candidates, candidates)
                 return parsed_move
             else:
-                print(f"❌ VALIDATION FAILED: Move object exists but is not in legal moves")
-                print(f"   Legal move objects: {legal_moves_objects[:10]}...")
+                logger.debug("VALIDATION FAILED: Move object exists but is not in legal moves; legal: %s...", legal_moves_objects[:10])
                 self._log_block("MOVE INVALID (NOT LEGAL)", [
                     f"Turn: {self.board.fullmove_number}",
                     f"Player: {self.current_player}",
@@ -866,7 +1148,7 @@ class ChessGame(BaseGame):
                     "Legal: False",
                 ])
         else:
-            print(f"❌ VALIDATION FAILED: Could not create move object from '{parsed_move}'")
+            logger.debug("VALIDATION FAILED: Could not create move object from '%s'", parsed_move)
             try:
                 if not hasattr(self, '_last_failure_reason'):
                     self._last_failure_reason = {}
@@ -877,141 +1159,240 @@ class ChessGame(BaseGame):
                 pass
         
         # Step 7: Final failure logging
-        print(f"\n💥 FINAL RESULT: MOVE REJECTED")
-        print(f"   AI wanted: '{parsed_move}'")
-        print(f"   Available UCI: {legal_moves_uci[:5]}...")
-        print(f"   Available SAN: {legal_moves_san[:5]}...")
-        print("="*80)
+        logger.debug("FINAL RESULT: MOVE REJECTED; AI wanted '%s'; available UCI: %s...; available SAN: %s...",
+                     parsed_move, legal_moves_uci[:5], legal_moves_san[:5])
         
         try:
-            from debug_console import debug_log
-            debug_log(f"VALIDATION FAILED: {parsed_move} not in legal moves")
-            debug_log(f"Legal UCI: {legal_moves_uci[:5]}")
-            debug_log(f"Legal SAN: {legal_moves_san[:5]}")
+            debug_log(f"VALIDATION FAILED: {parsed_move} not in legal moves\n"
+                      f"Legal UCI: {legal_moves_uci[:5]}\n"
+                      f"Legal SAN: {legal_moves_san[:5]}")
         except:
             pass
             
         return None
 
+    def _mentioned_legal_san(self, legal_moves: list[chess.Move], text: str) -> dict[str, chess.Move]:
+        """
+        SAN -> move for the legal moves that `text` can mention, in legal move order.
+        
+        Every SAN token contains its destination square (castling aside), so moves whose
+        destination does not appear in the text can never match a SAN search over it.
+        """
+        # One pass over the text collects every square name it contains
+        mentioned = set(_BARE_SQUARE_RE.findall(text.lower()))
+        sans: dict[str, chess.Move] = {}
+        for move_obj in legal_moves:
+            if chess.SQUARE_NAMES[move_obj.to_square] not in mentioned and not self.board.is_castling(move_obj):
+                continue
+            try:
+                sans[self._san_cached(move_obj)] = move_obj
+            except Exception as e:
+                logger.debug("Error converting %s to SAN: %s", move_obj, e)
+        return sans
+
+    def _extract_candidates(self, response: str, legal_moves: list[chess.Move],
+                            legal_moves_san: Optional[list[str]] = None) -> list[str]:
+        """Best-effort extraction of up to three legal SAN candidates named in the response."""
+        candidates: list[str] = []
+        try:
+            scope = response
+            cand_section = _CANDIDATES_SECTION_RE.search(response)
+            if cand_section:
+                scope = cand_section.group(1)
+            if legal_moves_san is None:
+                legal_moves_san = self._mentioned_legal_san(legal_moves, scope)
+            seen = set()
+            for san in legal_moves_san:
+                if san in seen:
+                    continue
+                if _san_token_re(san).search(scope):
+                    candidates.append(san)
+                    seen.add(san)
+                    if len(candidates) >= 3:
+                        break
+        except Exception:
+            candidates = []
+        return candidates
+
+    def _log_parse_success(self, response: str, parsed_move: str, move_obj: chess.Move, parsing_method: str,
+                           parse_start: float, first_line_is_move: bool, has_candidates: bool,
+                           candidates: list[str]) -> None:
+        """Emit the debug console records for a move that parsed to a legal move."""
+        parse_ms = int((time.time() - parse_start) * 1000)
+        logger.debug("VALIDATION SUCCESS: Move '%s' is valid", parsed_move)
+        try:
+            # Reasoning length
+            reasoning_chars = 0
+            try:
+                m = _REASONING_RE.search(response)
+                if m:
+                    reasoning_chars = len(m.group(1).strip())
+            except Exception:
+                pass
+            debug_log(f"VALIDATION SUCCESS: {parsed_move} -> {move_obj}; parse_ms={parse_ms}; first_line_is_move={first_line_is_move}; has_candidates={has_candidates}; reasoning_chars={reasoning_chars}; candidates={candidates}")
+            # JSON mirror
+            payload = {
+                "turn": self.board.fullmove_number,
+                "player": self.current_player,
+                "proposed": parsed_move,
+                "parsed_via": parsing_method,
+                "legal": True,
+                "parse_ms": parse_ms,
+                "first_line_is_move": first_line_is_move,
+                "has_candidates": bool(has_candidates),
+                "candidates": candidates,
+            }
+            debug_log(f"MOVE_VALIDATION_JSON: {json.dumps(payload, ensure_ascii=False)}")
+        except:
+            pass
+        # Emit a compact summary block for this validation
+        self._log_block("MOVE VALIDATION DETAILS", [
+            f"Turn: {self.board.fullmove_number}",
+            f"Player: {self.current_player}",
+            f"Proposed: {parsed_move} (parsed via {parsing_method})",
+            f"Legal: True",
+            f"Contract: first_line_is_move={first_line_is_move}, has_candidates={has_candidates}",
+            f"Candidates: {', '.join(candidates) if candidates else 'n/a'}",
+            f"Parse ms: {parse_ms}",
+        ])
+
     def _evaluate_material(self, board: chess.Board, perspective: Optional[bool] = None) -> int:
-        piece_values = {
-            chess.PAWN: 1,
-            chess.KNIGHT: 3,
-            chess.BISHOP: 3,
-            chess.ROOK: 5,
-            chess.QUEEN: 9,
-        }
-        score = 0
         if perspective is None:
             perspective = self.board.turn
-        for sq in chess.SQUARES:
-            p = board.piece_at(sq)
-            if not p:
-                continue
-            val = piece_values.get(p.piece_type, 0)
-            score += val if p.color == perspective else -val
-        return score
+        white, black = _material_totals(board)
+        return white - black if perspective == chess.WHITE else black - white
 
     def _compute_tactical_density(self) -> int:
         # Simple proxy: number of captures available + checks available
-        captures = sum(1 for m in self.board.legal_moves if self.board.is_capture(m))
+        board = self.board
+        moves = self._legal_moves_cached()
+        captures = sum(1 for m in moves if board.is_capture(m))
+        king = board.king(not board.turn)
         checks = 0
-        for m in list(self.board.legal_moves)[:50]:
-            self.board.push(m)
-            if self.board.is_check():
+        for m in itertools.islice(moves, 50):
+            # Moves that cannot give check skip the push/pop
+            if not _may_give_check(board, m, king):
+                continue
+            board.push(m)
+            if board.is_check():
                 checks += 1
-            self.board.pop()
+            board.pop()
         return captures + checks
 
     def _blunder_threshold(self) -> int:
+        # Same for every candidate move in a position, so the density scan runs once per position
+        key = self.board._transposition_key()
+        if self._threshold_cache is not None and self._threshold_cache[0] == key:
+            return self._threshold_cache[1]
         phase, _ = self.detect_game_phase()
         density = self._compute_tactical_density()
         # Relax in sharp positions, stricter in quiet endgames
         if phase == 'endgame' and density <= 2:
-            return 3
-        if density >= 6:
-            return 5
-        return 4
+            threshold = 3
+        elif density >= 6:
+            threshold = 5
+        else:
+            threshold = 4
+        self._threshold_cache = (key, threshold)
+        return threshold
 
     def _would_be_gross_blunder(self, move: chess.Move) -> bool:
         # Phase/tactical-aware threshold (adjust if side is already behind)
         threshold = self._blunder_threshold()
-        perspective = self.board.turn
-        baseline = self._evaluate_material(self.board, perspective)
+        board = self.board
+        perspective = board.turn
+        baseline = self._evaluate_material(board, perspective)
         if baseline < -2:
             # If already worse materially, allow more risk-taking
             threshold += 1
-        temp = self.board.copy()
         hanging_before = self._get_hanging_squares_for_current()
-        temp.push(move)
-        # If our move immediately checkmates, never veto
-        try:
-            if temp.is_checkmate():
-                return False
-        except Exception:
-            pass
-        # Record if the move gives check to relax threshold for forcing moves
-        try:
-            gives_check = temp.is_check()
-        except Exception:
-            gives_check = False
-        worst_drop = 0
-        worst_line = None
-        # Prioritize forcing replies first
-        replies = list(temp.legal_moves)
-        forcing = [m for m in replies if temp.is_capture(m)]
-        replies = forcing + [m for m in replies if m not in forcing]
-        for idx, opp_move in enumerate(replies[:12]):
-            temp.push(opp_move)
-            delta = baseline - self._evaluate_material(temp, perspective)
-            if delta > worst_drop:
-                worst_drop = delta
-                worst_line = opp_move
-            temp.pop()
-        # If the move evacuates a hanging piece to safety, be more permissive
-        try:
-            if move.from_square in hanging_before:
-                new_sq = move.to_square
-                attackers_new = len(temp.attackers(not self.board.turn, new_sq))
-                defenders_new = len(temp.attackers(self.board.turn, new_sq))
-                if attackers_new <= defenders_new:
-                    threshold += 1
-        except Exception:
-            pass
-
-        # Explicit queen-sac hard rule: if queen is captured next move without compensation, veto
-        queen_sac = False
-        try:
-            # If our queen is en prise after our move and can be taken immediately with net <= -7
-            qsq = None
-            for sq in chess.SQUARES:
-                p = temp.piece_at(sq)
-                if p and p.piece_type == chess.QUEEN and p.color == perspective:
-                    qsq = sq
-                    break
-            if qsq is not None:
-                opp_attackers = list(temp.attackers(not perspective, qsq))
-                if opp_attackers:
-                    # Take queen and evaluate delta
-                    cap_move = chess.Move(opp_attackers[0], qsq)
-                    if cap_move in temp.legal_moves:
-                        temp.push(cap_move)
-                        delta_q = baseline - self._evaluate_material(temp, perspective)
-                        # Require a clearer large loss to mark as queen sac
-                        queen_sac = delta_q >= 8
-                        temp.pop()
-        except Exception:
-            pass
         # Relax for forcing moves: bump threshold for queen moves and any checking move
         try:
-            is_queen_move = (self.board.piece_at(move.from_square) and self.board.piece_at(move.from_square).piece_type == chess.QUEEN)
+            is_queen_move = board.piece_type_at(move.from_square) == chess.QUEEN
         except Exception:
             is_queen_move = False
-        adjusted_threshold = threshold
-        if is_queen_move:
-            adjusted_threshold += 1
-        if gives_check:
-            adjusted_threshold += 2
+        # Material we win immediately (capture and/or promotion); the static exchange check nets this out
+        captured_type = chess.PAWN if board.is_en_passant(move) else board.piece_type_at(move.to_square)
+        material_gain = _SEE_VALUES[captured_type] if captured_type else 0
+        if move.promotion:
+            material_gain += _SEE_VALUES[move.promotion] - _SEE_VALUES[chess.PAWN]
+        # Make/unmake on the live board rather than copying it; the finally block restores the position
+        board.push(move)
+        try:
+            # Cheap exit: with no knight-or-better of ours attacked and no opponent pawn about to promote,
+            # every reply wins at most a pawn, which is below any threshold, so a veto is impossible
+            them = not perspective
+            valuable = board.occupied_co[perspective] & (board.knights | board.bishops | board.rooks | board.queens)
+            promo_rank = chess.BB_RANK_2 if them == chess.BLACK else chess.BB_RANK_7
+            if (not board.pawns & board.occupied_co[them] & promo_rank
+                    and not any(board.is_attacked_by(them, sq) for sq in chess.scan_forward(valuable))):
+                return False
+            # If our move immediately checkmates, never veto
+            try:
+                if board.is_checkmate():
+                    return False
+            except Exception:
+                pass
+            # Record if the move gives check to relax threshold for forcing moves
+            try:
+                gives_check = board.is_check()
+            except Exception:
+                gives_check = False
+            # If the move evacuates a hanging piece to safety, be more permissive
+            try:
+                if move.from_square in hanging_before:
+                    new_sq = move.to_square
+                    attackers_new = len(board.attackers(not perspective, new_sq))
+                    defenders_new = len(board.attackers(perspective, new_sq))
+                    if attackers_new <= defenders_new:
+                        threshold += 1
+            except Exception:
+                pass
+            adjusted_threshold = threshold
+            if is_queen_move:
+                adjusted_threshold += 1
+            if gives_check:
+                adjusted_threshold += 2
+            worst_drop = 0
+            worst_line = None
+            queen_sac = False
+            # Prioritize forcing replies first
+            replies = _captures_first(board, list(board.legal_moves))
+            # A reply only changes material by what it captures or promotes, so no make/unmake per reply
+            after_move_drop = baseline - self._evaluate_material(board, perspective)
+            for opp_move in replies[:12]:
+                delta = after_move_drop + _material_won(board, opp_move)
+                if delta > worst_drop:
+                    worst_drop = delta
+                    worst_line = opp_move
+
+            # Static exchange on the destination square also counts, in case the losing capture
+            # sequence starts with a reply outside the scanned ones
+            see_gain, see_capture = self._see(move.to_square)
+            if see_gain - material_gain > worst_drop:
+                worst_drop = see_gain - material_gain
+                worst_line = see_capture
+
+            # Explicit queen-sac hard rule: if queen is captured next move without compensation, veto
+            try:
+                # If our queen is en prise after our move and can be taken immediately with net <= -7
+                queens = board.pieces_mask(chess.QUEEN, perspective)
+                qsq = chess.lsb(queens) if queens else None
+                if qsq is not None:
+                    opp_attackers = list(board.attackers(not perspective, qsq))
+                    if opp_attackers:
+                        # Take queen and evaluate delta
+                        cap_move = chess.Move(opp_attackers[0], qsq)
+                        if cap_move in board.legal_moves:
+                            board.push(cap_move)
+                            delta_q = baseline - self._evaluate_material(board, perspective)
+                            # Require a clearer large loss to mark as queen sac
+                            queen_sac = delta_q >= 8
+                            board.pop()
+            except Exception:
+                pass
+        finally:
+            board.pop()
         veto = queen_sac or (worst_drop >= adjusted_threshold)
         # Record blunder info for feedback
         try:
@@ -1029,64 +1410,144 @@ class ChessGame(BaseGame):
             pass
         return veto
 
+    def _see(self, square: chess.Square) -> tuple[int, Optional[chess.Move]]:
+        """
+        Static exchange evaluation of capturing on `square` for the side to move.
+        
+        Returns:
+            tuple: (gain, first_capture) where gain is the material (pawn units) the side to move
+                   nets by starting the exchange, or 0 if no capture pays; first_capture is the
+                   legal capture that starts it (None when there is none)
+        """
+        board = self.board
+        target = board.piece_type_at(square)
+        if target is None:
+            return 0, None
+        side = board.turn
+        back_rank = chess.square_rank(square) in (0, 7)
+        # The opening capture must be legal (pins, checks); later recaptures are pseudo-legal
+        first_capture = None
+        attacker_type = None
+        attackers = board.attackers_mask(side, square)
+        for piece_type in chess.PIECE_TYPES:
+            for from_sq in chess.scan_forward(attackers & board.pieces_mask(piece_type, side)):
+                promotion = chess.QUEEN if piece_type == chess.PAWN and back_rank else None
+                candidate = chess.Move(from_sq, square, promotion=promotion)
+                if board.is_legal(candidate):
+                    first_capture, attacker_type = candidate, piece_type
+                    break
+            if first_capture:
+                break
+        if first_capture is None:
+            return 0, None
+        # Swap list: gains[d] is the balance for the side making capture d if the exchange stops there
+        gains = [_SEE_VALUES[target]]
+        attacker_value = _SEE_VALUES[attacker_type]
+        occupied = board.occupied & ~chess.BB_SQUARES[first_capture.from_square]
+        side = not side
+        while True:
+            attackers = _attackers_mask(board, side, square, occupied)
+            if not attackers:
+                break
+            for piece_type in chess.PIECE_TYPES:
+                bb = attackers & board.pieces_mask(piece_type, side)
+                if bb:
+                    break
+            if piece_type == chess.KING and _attackers_mask(board, not side, square, occupied & ~bb):
+                break  # the king cannot recapture into a defended square
+            gains.append(attacker_value - gains[-1])
+            occupied &= ~chess.BB_SQUARES[chess.lsb(bb)]
+            attacker_value = _SEE_VALUES[piece_type]
+            side = not side
+        for d in range(len(gains) - 1, 0, -1):
+            gains[d - 1] = -max(-gains[d - 1], gains[d])
+        return max(0, gains[0]), first_capture
+
     def _get_checking_pieces(self) -> List[str]:
-        if not self.board.is_check():
+        board = self.board
+        checkers_mask = board.checkers_mask()
+        if not checkers_mask:
             return []
+        white_checks = board.turn == chess.BLACK
         checkers = []
-        king_sq = self.board.king(self.board.turn)
-        for sq in self.board.attackers(not self.board.turn, king_sq):
-            piece = self.board.piece_at(sq)
-            if piece:
-                checkers.append(f"{piece.symbol()} on {chess.square_name(sq)}")
+        for sq in chess.scan_forward(checkers_mask):
+            symbol = chess.piece_symbol(board.piece_type_at(sq))
+            checkers.append(f"{symbol.upper() if white_checks else symbol} on {chess.SQUARE_NAMES[sq]}")
         return checkers
 
-    def _find_hanging_pieces(self) -> List[str]:
-        hanging: List[str] = []
-        for sq in chess.SQUARES:
-            piece = self.board.piece_at(sq)
-            if piece and piece.color == self.board.turn:
-                attackers = len(self.board.attackers(not self.board.turn, sq))
-                defenders = len(self.board.attackers(self.board.turn, sq))
-                if attackers > defenders:
-                    hanging.append(f"{piece.symbol()} on {chess.square_name(sq)} (attacked {attackers}, defended {defenders})")
-        return hanging
+    def _scan_hanging(self) -> tuple:
+        """
+        Side-to-move pieces attacked more often than defended, computed once per position.
+        
+        Returns:
+            tuple: (square, attackers, defenders) entries in square order, shared by the
+                   threat text and the blunder/fallback checks
+        """
+        board = self.board
+        key = board._transposition_key()
+        if self._hanging_cache is not None and self._hanging_cache[0] == key:
+            return self._hanging_cache[1]
+        turn = board.turn
+        hanging = []
+        # Only our own pieces can hang; unattacked ones need no defender count
+        for sq in chess.scan_forward(board.occupied_co[turn]):
+            attackers = chess.popcount(board.attackers_mask(not turn, sq))
+            if not attackers:
+                continue
+            defenders = chess.popcount(board.attackers_mask(turn, sq))
+            if attackers > defenders:
+                hanging.append((sq, attackers, defenders))
+        result = tuple(hanging)
+        self._hanging_cache = (key, result)
+        return result
 
     def _get_hanging_squares_for_current(self) -> List[int]:
-        squares: List[int] = []
-        for sq in chess.SQUARES:
-            piece = self.board.piece_at(sq)
-            if piece and piece.color == self.board.turn:
-                attackers = len(self.board.attackers(not self.board.turn, sq))
-                defenders = len(self.board.attackers(self.board.turn, sq))
-                if attackers > defenders:
-                    squares.append(sq)
-        return squares
-
-    def _find_protected_attacks(self) -> List[str]:
+        return [sq for sq, _, _ in self._scan_hanging()]
+
+    def _analyze_threats(self) -> tuple[List[str], List[str], List[str]]:
+        """
+        Collect checkers, own hanging pieces and opponent pieces we attack.
+        
+        Returns:
+            tuple: (checkers, hanging, protected_attacks) description lists used by get_threats
+        """
+        board = self.board
+        turn = board.turn
+        hanging: List[str] = []
+        for sq, attackers, defenders in self._scan_hanging():
+            symbol = chess.piece_symbol(board.piece_type_at(sq))
+            if turn == chess.WHITE:
+                symbol = symbol.upper()
+            hanging.append(f"{symbol} on {chess.SQUARE_NAMES[sq]} (attacked {attackers}, defended {defenders})")
         traps: List[str] = []
-        # Look for opponent pieces attacked that are insufficiently defended
-        for sq in chess.SQUARES:
-            piece = self.board.piece_at(sq)
-            if piece and piece.color != self.board.turn:
-                attackers = list(self.board.attackers(self.board.turn, sq))
-                if not attackers:
-                    continue
-                defenders = list(self.board.attackers(not self.board.turn, sq))
-                if len(attackers) > len(defenders):
-                    traps.append(f"Attack on {piece.symbol()} at {chess.square_name(sq)} may win material")
-        return traps
+        for sq in chess.scan_forward(board.occupied_co[not turn]):
+            # Opponent pieces attacked that are insufficiently defended
+            attackers = chess.popcount(board.attackers_mask(turn, sq))
+            if not attackers:
+                continue
+            defenders = chess.popcount(board.attackers_mask(not turn, sq))
+            if attackers > defenders:
+                symbol = chess.piece_symbol(board.piece_type_at(sq))
+                if turn == chess.BLACK:
+                    symbol = symbol.upper()
+                traps.append(f"Attack on {symbol} at {chess.SQUARE_NAMES[sq]} may win material")
+        return self._get_checking_pieces(), hanging, traps
 
     def get_threats(self) -> str:
+        key = self.board._transposition_key()
+        if self._threats_cache is not None and self._threats_cache[0] == key:
+            return self._threats_cache[1]
         threats: List[str] = []
-        if self.board.is_check():
-            threats.append(f"You are in check from {', '.join(self._get_checking_pieces())}.")
-        hanging = self._find_hanging_pieces()
+        checkers, hanging, protected_attacks = self._analyze_threats()
+        if checkers:
+            threats.append(f"You are in check from {', '.join(checkers)}.")
         if hanging:
             threats.append(f"Hanging pieces: {', '.join(hanging)}.")
-        protected_attacks = self._find_protected_attacks()
         if protected_attacks:
             threats.append(f"Potential traps: {', '.join(protected_attacks)}.")
-        return "\n".join(threats) if threats else "No immediate threats."
+        text = "\n".join(threats) if threats else "No immediate threats."
+        self._threats_cache = (key, text)
+        return text
 
     def get_model_params(self) -> dict:
         # Lower temperature in endgame for determinism; allow more tokens
@@ -1103,11 +1564,14 @@ class ChessGame(BaseGame):
 
     def get_safe_fallback_action(self) -> str:
         # Rank legal moves by worst-case eval vs forcing replies; skip per-turn vetoed moves
-        legal = list(self.board.legal_moves)
+        board = self.board
+        legal = self._legal_moves_cached()
         if not legal:
             return ""
         candidates: list[tuple[float, chess.Move]] = []
         hanging_before = self._get_hanging_squares_for_current()
+        perspective = board.turn
+        baseline = self._evaluate_material(board, perspective)
         for mv in legal:
             try:
                 uci = mv.uci()
@@ -1115,31 +1579,29 @@ class ChessGame(BaseGame):
                     continue
             except Exception:
                 pass
-            temp = self.board.copy()
-            temp.push(mv)
-            perspective = self.board.turn
-            baseline = self._evaluate_material(self.board, perspective)
-            replies = list(temp.legal_moves)
-            forcing = [m for m in replies if temp.is_capture(m)]
-            replies = forcing + [m for m in replies if m not in forcing]
-            worst = 0
-            for opp in replies[:10]:
-                temp.push(opp)
-                delta = baseline - self._evaluate_material(temp, perspective)
-                if delta > worst:
-                    worst = delta
-                temp.pop()
-            # Bonus if move evacuates a hanging piece to safety
-            bonus = 0.0
+            # Make/unmake on the live board instead of copying it per candidate
+            board.push(mv)
             try:
-                if mv.from_square in hanging_before:
-                    new_sq = mv.to_square
-                    attackers_new = len(temp.attackers(not self.board.turn, new_sq))
-                    defenders_new = len(temp.attackers(self.board.turn, new_sq))
-                    if attackers_new <= defenders_new:
-                        bonus += 0.5
-            except Exception:
-                pass
+                replies = _captures_first(board, list(board.legal_moves))
+                worst = 0
+                after_move_drop = baseline - self._evaluate_material(board, perspective)
+                for opp in replies[:10]:
+                    delta = after_move_drop + _material_won(board, opp)
+                    if delta > worst:
+                        worst = delta
+                # Bonus if move evacuates a hanging piece to safety
+                bonus = 0.0
+                try:
+                    if mv.from_square in hanging_before:
+                        new_sq = mv.to_square
+                        attackers_new = len(board.attackers(not perspective, new_sq))
+                        defenders_new = len(board.attackers(perspective, new_sq))
+                        if attackers_new <= defenders_new:
+                            bonus += 0.5
+                except Exception:
+                    pass
+            finally:
+                board.pop()
             candidates.append((-(worst - bonus), mv))  # higher is better (less worst-case loss)
         if not candidates:
             # fallback to any legal move if all vetoed
@@ -1150,35 +1612,35 @@ class ChessGame(BaseGame):
 
     def get_safe_candidates(self, limit: int = 3) -> list[str]:
         """Return up to `limit` safe candidate UCI moves ranked by worst-case outcome."""
-        legal = list(self.board.legal_moves)
+        board = self.board
+        legal = self._legal_moves_cached()
         scored: list[tuple[float, str]] = []
-        perspective = self.board.turn
-        baseline = self._evaluate_material(self.board, perspective)
+        perspective = board.turn
+        baseline = self._evaluate_material(board, perspective)
         hanging_before = self._get_hanging_squares_for_current()
         for mv in legal:
+            # Make/unmake on the live board instead of copying it per candidate
+            board.push(mv)
             try:
-                temp = self.board.copy()
-                temp.push(mv)
-                replies = list(temp.legal_moves)
-                forcing = [m for m in replies if temp.is_capture(m)]
-                replies = forcing + [m for m in replies if m not in forcing]
+                replies = _captures_first(board, list(board.legal_moves))
                 worst = 0
+                after_move_drop = baseline - self._evaluate_material(board, perspective)
                 for opp in replies[:10]:
-                    temp.push(opp)
-                    delta = baseline - self._evaluate_material(temp, perspective)
+                    delta = after_move_drop + _material_won(board, opp)
                     if delta > worst:
                         worst = delta
-                    temp.pop()
                 bonus = 0.0
                 if mv.from_square in hanging_before:
                     new_sq = mv.to_square
-                    attackers_new = len(temp.attackers(not self.board.turn, new_sq))
-                    defenders_new = len(temp.attackers(self.board.turn, new_sq))
+                    attackers_new = len(board.attackers(not perspective, new_sq))
+                    defenders_new = len(board.attackers(perspective, new_sq))
                     if attackers_new <= defenders_new:
                         bonus += 0.5
                 scored.append((-(worst - bonus), mv.uci()))
             except Exception:
                 continue
+            finally:
+                board.pop()
         scored.sort(key=lambda x: (-x[0], x[1]))
         return [uci for _, uci in scored[:max(1, limit)]]
     
@@ -1194,62 +1656,36 @@ class ChessGame(BaseGame):
             PGN string representation of the game
         """
         try:
-            # Create a game from the current board
-            game = chess.pgn.Game.from_board(self.board)
-            
-            if include_headers:
-                # Get player names
-                player_names = list(self.players.keys())
-                white_player = player_names[0] if len(player_names) > 0 else "White"
-                black_player = player_names[1] if len(player_names) > 1 else "Black"
-                
-                # Set PGN headers
-                game.headers["Event"] = "AI vs AI Chess Battle"
-                game.headers["Site"] = "Players of Games App"
-                game.headers["Date"] = datetime.now().strftime("%Y.%m.%d")
-                game.headers["Round"] = "1"
-                game.headers["White"] = white_player
-                game.headers["Black"] = black_player
-                game.headers["Result"] = "*"  # Ongoing game
-                
-                # Add additional metadata
-                if hasattr(self, 'move_count'):
-                    game.headers["PlyCount"] = str(len(self.board.move_stack))
-            
-            # Convert to PGN string
-            exporter = chess.pgn.StringExporter(headers=include_headers, variations=False, comments=False)
-            pgn_str = game.accept(exporter)
-            
-            # Handle move truncation if requested
+            result = "*" if include_headers else self.board.result()
+            # Movetext cached by validate_and_apply_action is current unless the board was changed directly
+            cached = self._pgn_plies == len(self.board.move_stack)
             if max_moves and self.board.fullmove_number > max_moves:
-                lines = pgn_str.split('\n')
-                header_lines = []
-                move_lines = []
+                # Render only the last moves instead of exporting the whole game and splitting it
+                if cached:
+                    move_text = self._pgn_movetext_tail(result, max_moves * 2)
+                else:
+                    move_text = self._stack_movetext_tail(result, max_moves * 2)
+                if not include_headers:
+                    return move_text.strip()
+                return ("\n".join(self._pgn_history_header_lines()) + "\n\n" + move_text).strip()
+            
+            if cached:
+                # Movetext is already up to date; avoid replaying the whole game through the exporter
+                if include_headers:
+                    header_lines = self._pgn_history_header_lines()
+                    pgn_str = "\n".join(header_lines) + "\n\n" + self._pgn_movetext(result)
+                else:
+                    pgn_str = self._pgn_movetext(result)
+            else:
+                # Create a game from the current board
+                game = chess.pgn.Game.from_board(self.board)
                 
-                # Separate headers from moves
-                in_headers = True
-                for line in lines:
-                    if line.strip() == "":
-                        in_headers = False
-                        continue
-                    if in_headers and line.startswith('['):
-                        header_lines.append(line)
-                    elif not in_headers:
-                        move_lines.append(line)
+                if include_headers:
+                    self._set_pgn_history_headers(game.headers)
                 
-                # Reconstruct with truncated moves
-                if move_lines:
-                    move_text = ' '.join(move_lines)
-                    # Simple truncation - keep last portion
-                    moves = move_text.split()
-                    if len(moves) > max_moves * 2:  # Approximate move pairs
-                        truncated_moves = moves[-(max_moves * 2):]
-                        move_text = "... " + ' '.join(truncated_moves)
-                    
-                    if include_headers:
-                        pgn_str = '\n'.join(header_lines) + '\n\n' + move_text
-                    else:
-                        pgn_str = move_text
+                # Convert to PGN string
+                exporter = chess.pgn.StringExporter(headers=include_headers, variations=False, comments=False)
+                pgn_str = game.accept(exporter)
             
             return pgn_str.strip()
             
@@ -1257,6 +1693,91 @@ class ChessGame(BaseGame):
             print(f"ERROR: Failed to generate PGN: {e}")
             return f"[PGN generation failed: {str(e)}]"
     
+    def _pgn_history_header_lines(self) -> list[str]:
+        """Header lines as Game.from_board would export them, without replaying the moves."""
+        # Setting up the root position adds the FEN/SetUp tags for games that start from a custom position
+        game = chess.pgn.Game()
+        game.setup(self.board.root())
+        self._set_pgn_history_headers(game.headers)
+        return [f"[{tag} \"{value}\"]" for tag, value in game.headers.items()]
+    
+    def _set_pgn_history_headers(self, headers: chess.pgn.Headers) -> None:
+        """Fill in the PGN headers used by get_pgn_history."""
+        # Get player names
+        player_names = list(self.players.keys())
+        white_player = player_names[0] if len(player_names) > 0 else "White"
+        black_player = player_names[1] if len(player_names) > 1 else "Black"
+        
+        # Set PGN headers
+        headers["Event"] = "AI vs AI Chess Battle"
+        headers["Site"] = "Players of Games App"
+        headers["Date"] = self._game_date
+        headers["Round"] = "1"
+        headers["White"] = white_player
+        headers["Black"] = black_player
+        headers["Result"] = "*"  # Ongoing game
+        
+        # Add additional metadata
+        if hasattr(self, 'move_count'):
+            headers["PlyCount"] = str(len(self.board.move_stack))
+    
+    def _record_pgn_move(self, san_move: str) -> None:
+        """Append a move about to be pushed to the cached PGN movetext."""
+        if self._pgn_plies != len(self.board.move_stack):
+            # Board was changed outside validate_and_apply_action; get_pgn_history falls back to a full export
+            return
+        if self.board.turn == chess.WHITE:
+            self._write_pgn_token(f"{self.board.fullmove_number}. ")
+        elif self._pgn_plies == 0:
+            self._write_pgn_token(f"{self.board.fullmove_number}... ")
+        self._write_pgn_token(san_move + " ")
+        self._pgn_plies += 1
+    
+    def _write_pgn_token(self, token: str) -> None:
+        if 80 - len(self._pgn_line) < len(token):
+            if self._pgn_line:
+                self._pgn_lines.append(self._pgn_line.rstrip())
+            self._pgn_line = ""
+        self._pgn_line += token
+    
+    def _pgn_movetext(self, result: str) -> str:
+        """Render the cached movetext followed by the result token."""
+        lines = list(self._pgn_lines)
+        line = self._pgn_line
+        token = result + " "
+        if 80 - len(line) < len(token):
+            if line:
+                lines.append(line.rstrip())
+            line = ""
+        lines.append((line + token).rstrip())
+        return "\n".join(lines)
+    
+    def _pgn_movetext_tail(self, result: str, count: int) -> str:
+        """Join the last `count` movetext tokens, prefixed with "..." when earlier moves are dropped."""
+        tail = [result]
+        for line in itertools.chain((self._pgn_line,), reversed(self._pgn_lines)):
+            tail.extend(reversed(line.split()))
+            if len(tail) > count:
+                return "... " + " ".join(reversed(tail[:count]))
+        return " ".join(reversed(tail))
+    
+    def _stack_movetext_tail(self, result: str, count: int) -> str:
+        """Like _pgn_movetext_tail, but rendered from the last moves of the board's move stack."""
+        board = self.board.copy(stack=count)
+        ply = len(self.board.move_stack)
+        tail = [result]
+        while board.move_stack and len(tail) <= count:
+            move = board.pop()
+            ply -= 1
+            tail.append(board.san(move))
+            if board.turn == chess.WHITE:
+                tail.append(f"{board.fullmove_number}.")
+            elif ply == 0:
+                tail.append(f"{board.fullmove_number}...")
+        if len(tail) > count:
+            return "... " + " ".join(reversed(tail[:count]))
+        return " ".join(reversed(tail))
+    
     def detect_game_phase(self) -> tuple[str, dict]:
         """
         Intelligently detect the current game phase based on multiple factors.
@@ -1265,51 +1786,65 @@ class ChessGame(BaseGame):
             tuple: (phase_name, phase_info) where phase_name is 'opening', 'middlegame', or 'endgame'
                    and phase_info contains relevant statistics and characteristics
         """
-        # Count pieces and material
-        piece_count = 0
+        # Reuse the result while the position (and move number) is unchanged
+        key = (self.board._transposition_key(), self.board.fullmove_number)
+        if self._phase_cache is not None and self._phase_cache[0] == key:
+            return self._phase_cache[1]
+        result = self._detect_game_phase_uncached()
+        self._phase_cache = (key, result)
+        return result
+
+    def _board_stats(self) -> dict:
+        """
+        Piece counts and material for the current position, computed once per position.
+        
+        Returns:
+            dict: piece_count, material per colour and piece_types per colour (queens..pawns),
+                  shared by phase detection and the position analysis
+        """
+        key = self.board._transposition_key()
+        if self._stats_cache is not None and self._stats_cache[0] == key:
+            return self._stats_cache[1]
+        # Count pieces and material from the per-type bitboards instead of scanning squares
+        board = self.board
         material_count = {'white': 0, 'black': 0}
-        piece_types = {'white': {'queens': 0, 'rooks': 0, 'bishops': 0, 'knights': 0, 'pawns': 0},
-                      'black': {'queens': 0, 'rooks': 0, 'bishops': 0, 'knights': 0, 'pawns': 0}}
-        
-        piece_values = {chess.PAWN: 1, chess.KNIGHT: 3, chess.BISHOP: 3, 
-                       chess.ROOK: 5, chess.QUEEN: 9}
-        
-        for square in chess.SQUARES:
-            piece = self.board.piece_at(square)
-            if piece:
-                piece_count += 1
-                color = 'white' if piece.color == chess.WHITE else 'black'
-                material_count[color] += piece_values.get(piece.piece_type, 0)
-                
-                if piece.piece_type == chess.QUEEN:
-                    piece_types[color]['queens'] += 1
-                elif piece.piece_type == chess.ROOK:
-                    piece_types[color]['rooks'] += 1
-                elif piece.piece_type == chess.BISHOP:
-                    piece_types[color]['bishops'] += 1
-                elif piece.piece_type == chess.KNIGHT:
-                    piece_types[color]['knights'] += 1
-                elif piece.piece_type == chess.PAWN:
-                    piece_types[color]['pawns'] += 1
+        piece_types = {'white': {}, 'black': {}}
+        
+        type_masks = (('queens', chess.QUEEN, board.queens), ('rooks', chess.ROOK, board.rooks),
+                      ('bishops', chess.BISHOP, board.bishops), ('knights', chess.KNIGHT, board.knights),
+                      ('pawns', chess.PAWN, board.pawns))
+        
+        for color, color_mask in (('white', board.occupied_co[chess.WHITE]),
+                                  ('black', board.occupied_co[chess.BLACK])):
+            for name, piece_type, type_mask in type_masks:
+                count = chess.popcount(type_mask & color_mask)
+                piece_types[color][name] = count
+                material_count[color] += _PIECE_VALUE[piece_type] * count
+        
+        stats = {
+            'piece_count': chess.popcount(board.occupied),
+            'material': material_count,
+            'piece_types': piece_types,
+        }
+        self._stats_cache = (key, stats)
+        return stats
+
+    def _detect_game_phase_uncached(self) -> tuple[str, dict]:
+        """Compute the game phase for the current position (see detect_game_phase)."""
+        board = self.board
+        stats = self._board_stats()
+        piece_count = stats['piece_count']
+        material_count = stats['material']
+        piece_types = {color: dict(counts) for color, counts in stats['piece_types'].items()}
         
         move_number = self.board.fullmove_number
         total_material = material_count['white'] + material_count['black']
         
         # Check for castling rights (indicates opening/early middlegame)
-        castling_rights = self.board.has_kingside_castling_rights(chess.WHITE) or \
-                         self.board.has_queenside_castling_rights(chess.WHITE) or \
-                         self.board.has_kingside_castling_rights(chess.BLACK) or \
-                         self.board.has_queenside_castling_rights(chess.BLACK)
+        castling_rights = bool(board.clean_castling_rights())
         
         # Check for developed pieces (knights and bishops off starting squares)
-        developed_pieces = 0
-        starting_knight_squares = [chess.B1, chess.G1, chess.B8, chess.G8]
-        starting_bishop_squares = [chess.C1, chess.F1, chess.C8, chess.F8]
-        
-        for square in starting_knight_squares + starting_bishop_squares:
-            piece = self.board.piece_at(square)
-            if not piece or piece.piece_type not in [chess.KNIGHT, chess.BISHOP]:
-                developed_pieces += 1
+        developed_pieces = 8 - chess.popcount(_STARTING_MINORS & (board.knights | board.bishops))
         
         # Phase detection logic
         phase_info = {
@@ -1353,55 +1888,45 @@ class ChessGame(BaseGame):
         if len(self.board.move_stack) < 1:
             return "Opening"
         
+        # The name only depends on the first 10 plies, so reuse it until those change
+        key = tuple(self.board.move_stack[:10])
+        if self._opening_cache is not None and self._opening_cache[0] == key:
+            return self._opening_cache[1]
+        name = self._recognize_opening_uncached()
+        self._opening_cache = (key, name)
+        return name
+    
+    def _recognize_opening_uncached(self) -> str:
+        """Match the first 10 plies against the opening patterns (see recognize_opening)."""
         # Get first few moves in UCI format - increased to 10 plies for better detection
         moves = [move.uci() for move in self.board.move_stack[:10]]  # Up to 10 plies (5 moves) for variants
         
-        # Expanded patterns (top common from Lichess/Chess.com data; UCI format; sorted longest first for specificity)
-        opening_patterns = [
-            (["e2e4", "e7e5", "g1f3", "b8c6", "f1b5"], "Ruy Lopez"),  # Very common vs. e5
-            (["e2e4", "e7e5", "g1f3", "b8c6", "d2d4"], "Scotch Game"),
-            (["e2e4", "e7e5", "g1f3", "b8c6", "f1c4"], "Italian Game"),
-            (["e2e4", "e7e5", "g1f3", "g8f6"], "Petroff Defense"),
-            (["e2e4", "e7e5", "b1c3"], "Vienna Game"),
-            (["e2e4", "e7e5", "d1h5"], "Scholar's Mate Attempt"),  # Common beginner trap
-            (["e2e4", "e7e5"], "King's Pawn Game"),
-            (["e2e4", "c7c5"], "Sicilian Defense"),  # Most popular Black response to e4
-            (["e2e4", "e7e6"], "French Defense"),
-            (["e2e4", "c7c6"], "Caro-Kann Defense"),
-            (["e2e4", "g8f6"], "Alekhine Defense"),
-            (["e2e4", "d7d6"], "Pirc Defense"),
-            (["e2e4", "d7d5"], "Scandinavian Defense"),
-            (["d2d4", "d7d5", "c2c4"], "Queen's Gambit"),
-            (["d2d4", "g8f6", "c2c4", "e7e6", "b1c3", "f8b4"], "Nimzo-Indian Defense"),
-            (["d2d4", "g8f6", "c2c4", "g7g6", "b1c3", "d7d5"], "Grünfeld Defense"),
-            (["d2d4", "g8f6", "c2c4", "g7g6"], "King's Indian Defense"),
-            (["d2d4", "g8f6", "c2c4", "c7c5"], "Benoni Defense"),
-            (["d2d4", "g8f6"], "Indian Defenses (General)"),
-            (["d2d4", "d7d5"], "Queen's Pawn Game"),
-            (["c2c4"], "English Opening"),
-            (["g1f3"], "Réti Opening"),
-            (["d2d4", "f7f5"], "Dutch Defense"),
-            (["f2f4"], "Bird's Opening"),
-            (["b2b4"], "Polish Opening (Sokolsky)"),
-            (["g2g4"], "Grob's Attack"),
-        ]
-        
-        # Sort by descending pattern length to match specifics first
-        opening_patterns.sort(key=lambda x: len(x[0]), reverse=True)
-        
-        for pattern, name in opening_patterns:
-            if moves[:len(pattern)] == pattern:
-                return name
+        # Walk the opening trie; exact[d] is the pattern of length d matched exactly
+        exact: dict[int, str] = {}
+        node = _OPENING_TRIE
+        for depth, uci in enumerate(moves, 1):
+            node = node["next"].get(uci)
+            if node is None:
+                break
+            if node["name"]:
+                exact[depth] = node["name"]
+        
+        # Longest patterns first for specificity; at equal length an exact match beats a transposition
+        for length in _OPENING_LENGTHS:
+            if length in exact:
+                return exact[length]
             # Fallback for close matches (e.g., transposition variants)
-            if len(moves) >= len(pattern) and set(moves[:len(pattern)]) == set(pattern):
-                return f"Variant of {name}"
+            if len(moves) >= length:
+                name = _OPENING_VARIANTS.get((length, frozenset(moves[:length])))
+                if name:
+                    return f"Variant of {name}"
         
         return "Unknown Opening or Custom Position"
     
     def get_game_info(self) -> dict:
         """Get detailed information about the current game state."""
         return {
-            "fen": self.board.fen(),
+            "fen": self.get_state_text(),
             "turn": "White" if self.board.turn == chess.WHITE else "Black",
             "move_count": self.board.fullmove_number,
             "halfmove_clock": self.board.halfmove_clock,
@@ -1410,7 +1935,7 @@ class ChessGame(BaseGame):
             "is_stalemate": self.board.is_stalemate(),
             "is_insufficient_material": self.board.is_insufficient_material(),
             "can_claim_draw": self.board.can_claim_draw(),
-            "legal_moves_count": len(list(self.board.legal_moves))
+            "legal_moves_count": len(self._legal_moves_cached())
         }
     
     def export_pgn(self, filename: Optional[str] = None) -> str:
@@ -1423,13 +1948,15 @@ class ChessGame(BaseGame):
         Returns:
             PGN string
         """
-        # Create a new game
+        # Create a new game from the starting position (adds FEN/SetUp for set-up positions)
+        root = self.board.root()
         game = chess.pgn.Game()
+        game.setup(root)
         
         # Set headers
         game.headers["Event"] = "AI vs AI - Players of Games"
         game.headers["Site"] = "Local"
-        game.headers["Date"] = datetime.now().strftime("%Y.%m.%d")
+        game.headers["Date"] = self._game_date
         game.headers["Round"] = "1"
         
         # Set player names
@@ -1444,18 +1971,14 @@ class ChessGame(BaseGame):
         else:
             game.headers["Result"] = "*"
         
-        # Add moves
+        # Add moves as played; a legality check per ply (not parse_san) keeps the tree exportable
         node = game
-        temp_board = chess.Board()
-        
-        for san_move in self.moves_san:
-            try:
-                move = temp_board.parse_san(san_move)
-                node = node.add_variation(move)
-                temp_board.push(move)
-            except ValueError:
-                # Skip invalid moves
+        for move in self.moves_played:
+            if not root.is_legal(move):
+                # Skip moves that do not fit this start position
                 continue
+            node = node.add_variation(move)
+            root.push(move)
         
         # Convert to string
         exporter = chess.pgn.StringExporter(headers=True, variations=True, comments=True)
@@ -1472,37 +1995,33 @@ class ChessGame(BaseGame):
         
         return pgn_string
     
-    def get_position_analysis(self) -> dict:
-        """Get basic position analysis (requires additional libraries for deep analysis)."""
+    def get_position_analysis(self, components: Optional[set] = None) -> dict:
+        """
+        Get basic position analysis (requires additional libraries for deep analysis).
+        
+        Args:
+            components: Names of the analyses to run (material_balance, piece_activity,
+                        king_safety, center_control); None runs all of them
+            
+        Returns:
+            Dictionary with one entry per requested analysis
+        """
+        analyzers = {
+            "material_balance": self._calculate_material_balance,
+            "piece_activity": self._analyze_piece_activity,
+            "king_safety": self._analyze_king_safety,
+            "center_control": self._analyze_center_control
+        }
         analysis = {
-            "material_balance": self._calculate_material_balance(),
-            "piece_activity": self._analyze_piece_activity(),
-            "king_safety": self._analyze_king_safety(),
-            "center_control": self._analyze_center_control()
+            name: analyze() for name, analyze in analyzers.items()
+            if components is None or name in components
         }
         return analysis
     
     def _calculate_material_balance(self) -> dict:
         """Calculate material balance."""
-        piece_values = {
-            chess.PAWN: 1,
-            chess.KNIGHT: 3,
-            chess.BISHOP: 3,
-            chess.ROOK: 5,
-            chess.QUEEN: 9
-        }
-        
-        white_material = 0
-        black_material = 0
-        
-        for square in chess.SQUARES:
-            piece = self.board.piece_at(square)
-            if piece:
-                value = piece_values.get(piece.piece_type, 0)
-                if piece.color == chess.WHITE:
-                    white_material += value
-                else:
-                    black_material += value
+        material = self._board_stats()['material']
+        white_material, black_material = material['white'], material['black']
         
         return {
             "white": white_material,
@@ -1512,12 +2031,19 @@ class ChessGame(BaseGame):
     
     def _analyze_piece_activity(self) -> dict:
         """Analyze piece activity (simplified)."""
-        white_mobility = len([move for move in self.board.legal_moves])
-        
-        # Switch turns to calculate black mobility
-        self.board.push(chess.Move.null())
-        black_mobility = len([move for move in self.board.legal_moves])
-        self.board.pop()
+        white_mobility = len(self._legal_moves_cached())
+        
+        # Switch turns to calculate black mobility; flipping the side to move (and clearing the
+        # en passant square, as a null move would) avoids the push/pop bookkeeping
+        board = self.board
+        ep_square = board.ep_square
+        board.turn = not board.turn
+        board.ep_square = None
+        try:
+            black_mobility = board.legal_moves.count()
+        finally:
+            board.turn = not board.turn
+            board.ep_square = ep_square
         
         return {
             "white_mobility": white_mobility,
@@ -1530,25 +2056,16 @@ class ChessGame(BaseGame):
         black_king_square = self.board.king(chess.BLACK)
         
         return {
-            "white_king_square": chess.square_name(white_king_square) if white_king_square else None,
-            "black_king_square": chess.square_name(black_king_square) if black_king_square else None,
+            "white_king_square": chess.SQUARE_NAMES[white_king_square] if white_king_square else None,
+            "black_king_square": chess.SQUARE_NAMES[black_king_square] if black_king_square else None,
             "white_in_check": self.board.is_check() and self.board.turn == chess.WHITE,
             "black_in_check": self.board.is_check() and self.board.turn == chess.BLACK
         }
     
     def _analyze_center_control(self) -> dict:
         """Analyze center control (simplified)."""
-        center_squares = [chess.D4, chess.D5, chess.E4, chess.E5]
-        white_control = 0
-        black_control = 0
-        
-        for square in center_squares:
-            piece = self.board.piece_at(square)
-            if piece:
-                if piece.color == chess.WHITE:
-                    white_control += 1
-                else:
-                    black_control += 1
+        white_control = chess.popcount(self.board.occupied_co[chess.WHITE] & _CENTER)
+        black_control = chess.popcount(self.board.occupied_co[chess.BLACK] & _CENTER)
         
         return {
             "white_center_control": white_control,
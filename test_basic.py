@@ -52,6 +52,99 @@ class TestChessGame:
         assert initial_fen != new_fen
         assert "e4" in new_fen or game.board.piece_at(28) is not None  # e4 square
 
+    def test_blunder_check_restores_board(self):
+        """Test blunder check, fallback and safe candidates leave the live board untouched."""
+        players = {'player1': 'grok', 'player2': 'claude'}
+        game = ChessGame(players, log_to_file=False)
+        for move in ["e2e4", "e7e5", "d1h5"]:
+            game._force_apply_once = True
+            assert game.validate_and_apply_action(move)
+        game._force_apply_once = False
+
+        fen = game.get_state_text()
+        stack_len = len(game.board.move_stack)
+        for move in list(game.board.legal_moves):
+            game._would_be_gross_blunder(move)
+        game.get_safe_fallback_action()
+        game.get_safe_candidates(limit=3)
+
+        assert game.get_state_text() == fen
+        assert len(game.board.move_stack) == stack_len
+
+    def test_static_exchange_evaluation(self):
+        """Test static exchange evaluation on a defended and an undefended piece."""
+        import chess
+        players = {'player1': 'grok', 'player2': 'claude'}
+        game = ChessGame(players, log_to_file=False)
+
+        # Black wins a knight for a pawn: dxe5 dxe5
+        game.board.set_fen("4k3/8/3p4/4N3/3P4/8/8/4K3 b - - 0 1")
+        gain, capture = game._see(chess.E5)
+        assert gain == 2
+        assert capture == chess.Move.from_uci("d6e5")
+
+        # Queen takes a defended pawn: capturing does not pay
+        game.board.set_fen("4k3/8/2p5/3p4/8/8/8/3QK3 w - - 0 1")
+        assert game._see(chess.D5) == (0, chess.Move.from_uci("d1d5"))
+
+    def test_opening_recognition(self):
+        """Test opening names for exact lines and transposed move orders."""
+        players = {'player1': 'grok', 'player2': 'claude'}
+        game = ChessGame(players, log_to_file=False)
+        assert game.recognize_opening() == "Opening"
+
+        for move in ["e2e4", "e7e5", "g1f3", "b8c6", "f1b5"]:
+            game.board.push_uci(move)
+        assert game.recognize_opening() == "Ruy Lopez"
+
+        # Same moves as the Queen's Gambit in a different order
+        game.board.reset()
+        for move in ["c2c4", "d7d5", "d2d4"]:
+            game.board.push_uci(move)
+        assert game.recognize_opening() == "Variant of Queen's Gambit"
+
+    def test_pgn_history_truncation(self):
+        """Test max_moves keeps only the latest moves, with or without headers."""
+        players = {'player1': 'grok', 'player2': 'claude'}
+        game = ChessGame(players, log_to_file=False)
+        for move in ["g1f3", "g8f6", "f3g1", "f6g8"] * 3:
+            assert game.validate_and_apply_action(move)
+
+        tail = game.get_pgn_history(include_headers=False, max_moves=2)
+        assert tail == "... 6. Ng1 Ng8 *"
+        assert game.get_pgn_history(include_headers=True, max_moves=2).endswith("\n\n" + tail)
+
+        # Moves pushed directly bypass the cached movetext
+        game.board.push_uci("e2e4")
+        assert game.get_pgn_history(include_headers=False, max_moves=2) == "... Ng8 7. e4 *"
+
+    def test_pgn_history_custom_start_headers(self):
+        """Test PGN history from a set-up position keeps the FEN and SetUp tags."""
+        players = {'player1': 'grok', 'player2': 'claude'}
+        game = ChessGame(players, log_to_file=False)
+        start_fen = "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"
+        game.board.set_fen(start_fen)
+        for move in ["e2e4", "e8d8", "e4e5", "d8e8"]:
+            assert game.validate_and_apply_action(move)
+
+        for max_moves in (None, 1):
+            pgn = game.get_pgn_history(include_headers=True, max_moves=max_moves)
+            assert f'[FEN "{start_fen}"]' in pgn
+            assert '[SetUp "1"]' in pgn
+
+    def test_export_pgn_custom_start(self):
+        """Test PGN export of a game that starts from a set-up position."""
+        players = {'player1': 'grok', 'player2': 'claude'}
+        game = ChessGame(players, log_to_file=False)
+        start_fen = "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"
+        game.board.set_fen(start_fen)
+        for move in ["e2e4", "e8d8"]:
+            assert game.validate_and_apply_action(move)
+
+        pgn = game.export_pgn()
+        assert f'[FEN "{start_fen}"]' in pgn
+        assert "1. e4 Kd8" in pgn
+
 
 class TestTicTacToeGame:
     """Test Tic-Tac-Toe game functionality."""